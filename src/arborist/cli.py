@@ -2,7 +2,7 @@
 
 import logging
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, List
 
 import typer
 from rich import print
@@ -38,6 +38,22 @@ def _set_debug_logging(debug: bool) -> None:
         logging.getLogger("git").setLevel(logging.WARNING)
 
 
+def _parse_protect_option(protect: str) -> List[str]:
+    """Parse the comma-separated --protect option.
+
+    Parameters
+    ----------
+    protect : str
+        Comma-separated list of branch patterns
+
+    Returns
+    -------
+    List[str]
+        Branch patterns with surrounding whitespace removed
+    """
+    return [p.strip() for p in protect.split(",")]
+
+
 def _handle_git_error(err: GitError, exit_code: int = 1) -> None:
     """Handle git errors by printing them and exiting.
 
@@ -101,8 +117,7 @@ def clean(
         _set_debug_logging(debug)
         logger.debug(f"Using repository at: {path}")
         repo = GitRepo(path)
-        protect_list = [p.strip() for p in protect.split(",")]
-        repo.clean(protect_list, force, no_interactive, dry_run)
+        repo.clean(_parse_protect_option(protect), force, no_interactive, dry_run)
     except GitError as err:
         _handle_git_error(err)
 
@@ -214,7 +214,7 @@ class ArboristConfig(BaseSettings):
         try:
             config_path = Path(path)
             if config_path.exists():
-                file_config = cls.model_validate_json(config_path.read_text())
+                file_config = cls.model_validate_json(config_path.read_bytes())
                 config._update_from_file(file_config)
             return config
         except Exception as e:
@@ -7,6 +7,7 @@ from rich import print
 
 from arborist.errors import GitError
 from arborist.git.branch_status import BranchStatus, BranchStatusManager
+from arborist.git.common import compile_protect_patterns, delete_branches, get_worktree_branches
 
 logger = logging.getLogger(__name__)
 
@@ -14,16 +15,18 @@ logger = logging.getLogger(__name__)
 class BranchCleanup:
     """Branch cleanup operations."""
 
-    def __init__(self, repo: Repo) -> None:
+    def __init__(self, repo: Repo, status_manager: BranchStatusManager | None = None) -> None:
         """Initialize branch cleanup.
 
         Parameters
         ----------
         repo : Repo
             GitPython repository object
+        status_manager : Optional[BranchStatusManager]
+            Status manager to share. A new one is created if omitted.
         """
         self.repo = repo
-        self.status_manager = BranchStatusManager(repo)
+        self.status_manager = status_manager or BranchStatusManager(repo)
 
     def _is_protected_by_pattern(self, branch: str, patterns: list[str]) -> bool:
         """Check if a branch is protected by any pattern.
@@ -43,29 +46,21 @@ class BranchCleanup:
         if not patterns:
             return False
 
-        # First check for exact matches
-        if branch in patterns:
-            logger.debug("Branch '%s' is protected by exact match", branch)
+        # Exact, wildcard and prefix matches (e.g. 'main' protects 'main-1.0')
+        # are all checked by one compiled regex
+        if compile_protect_patterns(patterns).match(branch):
+            logger.debug("Branch '%s' is protected by patterns %s", branch, patterns)
             return True
 
-        # Then check for pattern matches
-        for pattern in patterns:
-            # Handle wildcard patterns
-            if "*" in pattern:
-                import fnmatch
-
-                if fnmatch.fnmatch(branch, pattern):
-                    logger.debug("Branch '%s' is protected by pattern '%s'", branch, pattern)
-                    return True
-            # Handle prefix matches (e.g. 'main' should protect 'main' and 'main-1.0')
-            elif branch == pattern or branch.startswith(pattern + "-") or branch.startswith(pattern + "/"):
-                logger.debug("Branch '%s' is protected by prefix '%s'", branch, pattern)
-                return True
-
         logger.debug("Branch '%s' is not protected", branch)
         return False
 
-    def _get_branches_to_delete(self, force: bool, protect: list[str] | None = None) -> list[str]:
+    def _get_branches_to_delete(
+        self,
+        force: bool,
+        protect: list[str] | None = None,
+        status: dict[str, BranchStatus] | None = None,
+    ) -> list[str]:
         """Get list of branches to delete.
 
         Parameters
@@ -74,17 +69,22 @@ class BranchCleanup:
             Whether to include unmerged branches
         protect : Optional[List[str]]
             List of branch patterns to protect
+        status : Optional[dict[str, BranchStatus]]
+            Branch status dictionary, if already known. Looked up when omitted.
 
         Returns
         -------
         List[str]
             List of branch names to delete
         """
-        status = self.status_manager.get_branch_status()
+        if status is None:
+            status = self.status_manager.get_branch_status()
         logger.debug("Getting branches to delete with force=%s", force)
         logger.debug("Branch status: %s", status)
         to_delete = []
         current = self.repo.active_branch.name
+        worktree_branches = get_worktree_branches(self.repo)
+        tracked_branches = set() if force else self.status_manager.get_branches_with_upstream()
 
         for branch, state in status.items():
             logger.debug("Processing branch '%s' with state '%s'", branch, state)
@@ -94,13 +94,18 @@ class BranchCleanup:
                 logger.debug("Skipping current branch '%s'", branch)
                 continue
 
+            # Skip branches checked out in another worktree
+            if branch in worktree_branches:
+                logger.debug("Skipping branch '%s' checked out at '%s'", branch, worktree_branches[branch])
+                continue
+
             # Skip protected branches
             if protect and self._is_protected_by_pattern(branch, protect):
                 logger.debug("Skipping protected branch '%s'", branch)
                 continue
 
             # Skip branches with remote tracking unless force is True or branch is gone
-            if not force and state != BranchStatus.GONE and self.repo.heads[branch].tracking_branch() is not None:
+            if not force and state != BranchStatus.GONE and branch in tracked_branches:
                 logger.debug("Skipping branch '%s' with remote tracking", branch)
                 continue
 
@@ -134,39 +139,85 @@ class BranchCleanup:
         if branch not in self.repo.heads:
             raise GitError(f"Branch '{branch}' does not exist")
 
-    def _validate_not_current_branch(self, branch: str) -> None:
+    def _validate_not_current_branch(self, branch: str, current: str | None = None) -> None:
         """Validate that a branch is not the current branch.
 
         Parameters
         ----------
         branch : str
             Branch name to validate
+        current : Optional[str]
+            Current branch name, if already known. Looked up when omitted.
 
         Raises
         ------
         GitError
             If branch is current branch
         """
-        if self.repo.active_branch.name == branch:
+        if current is None:
+            current = self.repo.active_branch.name
+        if current == branch:
             raise GitError(f"Cannot delete current branch '{branch}'")
 
-    def _validate_branch_merged(self, branch: str) -> None:
+    def _validate_branch_merged(self, branch: str, status: dict[str, BranchStatus] | None = None) -> None:
         """Validate that a branch is merged.
 
         Parameters
         ----------
         branch : str
             Branch name to validate
+        status : Optional[dict[str, BranchStatus]]
+            Branch status dictionary, if already known. Looked up when omitted.
 
         Raises
         ------
         GitError
             If branch is not merged
         """
-        status = self.status_manager.get_branch_status()
+        if status is None:
+            status = self.status_manager.get_branch_status()
         if status[branch] == BranchStatus.UNMERGED:
             raise GitError(f"Branch '{branch}' is not fully merged")
 
+    def _validate_deletion(
+        self, branch: str, force: bool, status: dict[str, BranchStatus], current: str | None = None
+    ) -> bool:
+        """Validate that a branch can be deleted.
+
+        Parameters
+        ----------
+        branch : str
+            Branch to validate
+        force : bool
+            Whether to force delete
+        status : dict[str, BranchStatus]
+            Branch status dictionary
+        current : Optional[str]
+            Current branch name, if already known. Looked up when omitted.
+
+        Returns
+        -------
+        bool
+            Whether the branch must be force deleted
+
+        Raises
+        ------
+        GitError
+            If the branch cannot be deleted
+        """
+        # Validate branch exists
+        self._validate_branch_exists(branch)
+
+        # Validate not current branch
+        self._validate_not_current_branch(branch, current)
+
+        # Check if branch is merged, gone, or force is True
+        if not force and status[branch] not in (BranchStatus.MERGED, BranchStatus.GONE):
+            self._validate_branch_merged(branch, status)
+
+        # Force delete if branch is gone or force is True
+        return force or status[branch] == BranchStatus.GONE
+
     def _find_safe_branch(self, current: str, to_delete: set[str]) -> str | None:
         """Find a safe branch to switch to.
 
@@ -237,7 +288,7 @@ class BranchCleanup:
             Success flag and message
         """
         try:
-            self.repo.delete_head(branch, force=force)
+            delete_branches(self.repo, [branch], force)
             print(f"Deleted branch '{branch}'")
             return True, ""
         except GitCommandError as err:
@@ -247,6 +298,50 @@ class BranchCleanup:
                 return False, "Branch has a remote tracking branch. Use --force to delete anyway"
             return False, f"Failed to delete branch: {err.stderr.splitlines()[0]}"
 
+    def _perform_batch_deletion(self, branches: list[str], force: bool) -> tuple[list[str], list[tuple[str, str]]]:
+        """Delete several branches with a single git call.
+
+        If git refuses some of the branches, the ones left behind are retried
+        one by one so that each failure gets its own error message.
+
+        Parameters
+        ----------
+        branches : List[str]
+            Branches to delete
+        force : bool
+            Whether to force delete
+
+        Returns
+        -------
+        Tuple[List[str], List[Tuple[str, str]]]
+            List of successfully deleted branches and list of failed branches with
+            error messages
+        """
+        if not branches:
+            return [], []
+
+        try:
+            delete_branches(self.repo, branches, force)
+            remaining = set()
+        except GitCommandError:
+            remaining = {head.name for head in self.repo.heads}
+
+        deleted = []
+        failed = []
+        for branch in branches:
+            if branch not in remaining:
+                print(f"Deleted branch '{branch}'")
+                deleted.append(branch)
+                continue
+
+            success, error = self._perform_branch_deletion(branch, force)
+            if success:
+                deleted.append(branch)
+            else:
+                failed.append((branch, error))
+
+        return deleted, failed
+
     def _delete_single_branch(
         self, branch: str, force: bool, status: dict[str, BranchStatus]
     ) -> tuple[bool, str | None]:
@@ -267,18 +362,7 @@ class BranchCleanup:
             Success flag and optional error message
         """
         try:
-            # Validate branch exists
-            self._validate_branch_exists(branch)
-
-            # Validate not current branch
-            self._validate_not_current_branch(branch)
-
-            # Check if branch is merged, gone, or force is True
-            if not force and status[branch] not in (BranchStatus.MERGED, BranchStatus.GONE):
-                self._validate_branch_merged(branch)
-
-            # Force delete if branch is gone or force is True
-            should_force = force or status[branch] == BranchStatus.GONE
+            should_force = self._validate_deletion(branch, force, status)
 
             # Perform deletion
             success, error = self._perform_branch_deletion(branch, should_force)
@@ -368,12 +452,20 @@ class BranchCleanup:
         deleted = []
         failed = []
 
+        # Validate everything first, then group the branches by force flag so
+        # each group is deleted with a single git call
+        groups: dict[bool, list[str]] = {False: [], True: []}
+        current = self.repo.active_branch.name
         for branch in to_delete:
-            success, error = self._delete_single_branch(branch, force, status)
-            if success:
-                deleted.append(branch)
-            else:
-                failed.append((branch, error))
+            try:
+                groups[self._validate_deletion(branch, force, status, current)].append(branch)
+            except GitError as err:
+                failed.append((branch, str(err)))
+
+        for should_force, branches in groups.items():
+            group_deleted, group_failed = self._perform_batch_deletion(branches, should_force)
+            deleted.extend(group_deleted)
+            failed.extend(group_failed)
 
         return deleted, failed
 
@@ -383,6 +475,7 @@ class BranchCleanup:
         force: bool,
         no_interactive: bool,
         dry_run: bool,
+        status: dict[str, BranchStatus] | None = None,
     ) -> None:
         """Delete branches in clean operation.
 
@@ -396,6 +489,8 @@ class BranchCleanup:
             Whether to skip confirmation prompts
         dry_run : bool
             Whether to only show what would be done
+        status : Optional[dict[str, BranchStatus]]
+            Branch status dictionary, if already known. Looked up when omitted.
 
         Raises
         ------
@@ -417,7 +512,8 @@ class BranchCleanup:
             return
 
         # Get branch status
-        status = self.status_manager.get_branch_status()
+        if status is None:
+            status = self.status_manager.get_branch_status()
 
         # Delete branches
         deleted, failed = self._delete_branches_batch(to_delete, force, status)
@@ -454,11 +550,14 @@ class BranchCleanup:
         GitError
             If any branch deletion fails
         """
+        # Branch status does not change before deletion starts, so look it up once
+        status = self.status_manager.get_branch_status()
+
         # Get branches to delete
-        to_delete = self._get_branches_to_delete(force, protect)
+        to_delete = self._get_branches_to_delete(force, protect, status)
 
         # Delete branches
-        self._delete_branches_in_clean(to_delete, force, no_interactive, dry_run)
+        self._delete_branches_in_clean(to_delete, force, no_interactive, dry_run, status)
 
     def delete_branch(self, branch: str, force: bool = False) -> None:
         """Delete a branch.
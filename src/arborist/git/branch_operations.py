@@ -1,20 +1,27 @@
 """Branch operations."""
 
-from typing import List, Optional, Set
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
 
-from git import GitCommandError, Head, Remote
+from git import GitCommandError, Head, Remote, RemoteReference
 from git.repo.base import Repo as GitRepo
 
 from arborist.errors import GitError
 from arborist.git.common import (
     BranchName,
+    compile_protect_patterns,
+    delete_branches,
     get_branch,
     get_current_branch_name,
+    get_worktree_branches,
     is_branch_upstream_of_another,
     validate_branch_exists,
     validate_branch_name,
 )
 
+# Upper bound on concurrent pushes to different remotes when deleting branches
+MAX_PUSH_WORKERS = 8
+
 
 class BranchOperations:
     """Branch operations."""
@@ -28,6 +35,9 @@ class BranchOperations:
             Git repository
         """
         self.repo = repo
+        # Ancestry results keyed by (branch SHA, other SHA). Commits never
+        # change, so entries stay valid when branches move or are deleted.
+        self._upstream_cache: Dict[Tuple[str, str], bool] = {}
 
     def _validate_not_current_branch(self, branch: Head) -> None:
         """Validate that a branch is not the current branch.
@@ -60,23 +70,76 @@ class BranchOperations:
         GitError
             If branch is protected
         """
-        # First check for exact matches
-        if branch.name in protected_branches:
+        # Exact, wildcard and prefix matches (e.g. 'main' protects 'main-1.0')
+        if compile_protect_patterns(protected_branches).match(branch.name):
             raise GitError(f"Cannot delete protected branch '{branch.name}'")
 
-        # Then check for pattern matches
-        for pattern in protected_branches:
-            # Handle wildcard patterns
-            if "*" in pattern:
-                import fnmatch
+    def _push_branch_deletions(self, remote_name: str, branches: List[Tuple[Head, RemoteReference]]) -> None:
+        """Delete several branches from one remote with a single push.
+
+        Parameters
+        ----------
+        remote_name : str
+            Name of the remote to delete the branches from
+        branches : List[Tuple[Head, RemoteReference]]
+            Local branches paired with their remote-tracking branches
+
+        Raises
+        ------
+        GitError
+            If the remote branches cannot be deleted
+        """
+        try:
+            # A successful push also removes the remote-tracking refs
+            self.repo.git.push(remote_name, "--delete", *(branch.name for branch, _ in branches))
+        except GitCommandError as err:
+            # git rejects the whole push if any ref is already gone on the
+            # remote, naming each missing ref in the error
+            missing = [
+                (branch, tracking_branch)
+                for branch, tracking_branch in branches
+                if f"unable to delete '{branch.name}': remote ref does not exist" in str(err)
+            ]
+            if not missing:
+                raise GitError(f"Failed to delete remote branch: {err}") from err
+
+            # Drop the stale remote-tracking refs without a full fetch
+            for _, tracking_branch in missing:
+                if tracking_branch.is_valid():
+                    self.repo.git.update_ref("-d", tracking_branch.path)
+
+            remaining = [pair for pair in branches if pair not in missing]
+            if remaining:
+                self._push_branch_deletions(remote_name, remaining)
+
+    def _delete_remote_branches(self, branches: List[Tuple[Head, RemoteReference]]) -> None:
+        """Delete the remote branches of several local branches.
+
+        Branches are grouped by remote so each remote gets a single push.
+        Pushes to different remotes run in a bounded thread pool.
+
+        Parameters
+        ----------
+        branches : List[Tuple[Head, RemoteReference]]
+            Local branches paired with their remote-tracking branches
 
-                if fnmatch.fnmatch(branch.name, pattern):
-                    raise GitError(f"Cannot delete protected branch '{branch.name}'")
-            # Handle prefix matches (e.g. 'main' should protect 'main' and 'main-1.0')
-            elif (
-                branch.name.startswith(pattern + "-") or branch.name.startswith(pattern + "/") or branch.name == pattern
-            ):
-                raise GitError(f"Cannot delete protected branch '{branch.name}'")
+        Raises
+        ------
+        GitError
+            If any remote branch cannot be deleted
+        """
+        by_remote: Dict[str, List[Tuple[Head, RemoteReference]]] = {}
+        for branch, tracking_branch in branches:
+            by_remote.setdefault(tracking_branch.remote_name, []).append((branch, tracking_branch))
+
+        with ThreadPoolExecutor(max_workers=min(MAX_PUSH_WORKERS, len(by_remote))) as executor:
+            futures = [
+                executor.submit(self._push_branch_deletions, remote_name, remote_branches)
+                for remote_name, remote_branches in by_remote.items()
+            ]
+        errors = [error for error in (future.exception() for future in futures) if error]
+        if errors:
+            raise GitError("; ".join(str(error) for error in errors)) from errors[0]
 
     def _delete_branch_safely(self, branch: Head, force: bool = False) -> None:
         """Delete a branch safely.
@@ -104,29 +167,21 @@ class BranchOperations:
 
             # Delete remote branch first if it exists and force is True
             if tracking_branch and force:
-                remote = tracking_branch.remote_name
-                try:
-                    self.repo.git.push(remote, "--delete", branch.name)
-                except GitCommandError as err:
-                    # Ignore errors about non-existent remote branches
-                    if "remote ref does not exist" not in str(err):
-                        raise GitError(f"Failed to delete remote branch: {err}") from err
-                # Fetch to update remote refs
-                self.repo.git.fetch(remote, "--prune")
+                self._push_branch_deletions(tracking_branch.remote_name, [(branch, tracking_branch)])
 
             # Delete local branch
-            self.repo.delete_head(branch.name, force=force)
+            delete_branches(self.repo, [branch.name], force)
         except GitCommandError as err:
             raise GitError(f"Failed to delete branch: {err}") from err
 
-    def delete_branch(
+    def _get_deletable_branch(
         self,
         branch_name: BranchName,
         force: bool = False,
         no_verify: bool = False,
         protected_branches: Optional[List[str]] = None,
-    ) -> None:
-        """Delete a branch.
+    ) -> Head:
+        """Get a branch after verifying that it can be deleted.
 
         Parameters
         ----------
@@ -139,10 +194,15 @@ class BranchOperations:
         protected_branches : Optional[List[str]], optional
             List of protected branch names, by default None
 
+        Returns
+        -------
+        Head
+            Branch to delete
+
         Raises
         ------
         GitError
-            If branch deletion fails
+            If the branch is invalid or cannot be deleted
         """
         # Validate branch name first
         validate_branch_name(branch_name)
@@ -160,6 +220,35 @@ class BranchOperations:
             if not force and not self._is_branch_merged(branch):
                 raise GitError(f"Branch '{branch.name}' is not fully merged")
 
+        return branch
+
+    def delete_branch(
+        self,
+        branch_name: BranchName,
+        force: bool = False,
+        no_verify: bool = False,
+        protected_branches: Optional[List[str]] = None,
+    ) -> None:
+        """Delete a branch.
+
+        Parameters
+        ----------
+        branch_name : BranchName
+            Name of the branch to delete
+        force : bool, optional
+            Force deletion even if branch is not merged, by default False
+        no_verify : bool, optional
+            Skip verification checks, by default False
+        protected_branches : Optional[List[str]], optional
+            List of protected branch names, by default None
+
+        Raises
+        ------
+        GitError
+            If branch deletion fails
+        """
+        branch = self._get_deletable_branch(branch_name, force, no_verify, protected_branches)
+
         try:
             # Delete branch
             self._delete_branch_safely(branch, force)
@@ -180,12 +269,17 @@ class BranchOperations:
             True if branch is merged, False otherwise
         """
         # Check if branch is merged into any other branch
+        branch_sha = branch.commit.hexsha
         for other_branch in self.repo.heads:
-            if other_branch != branch and is_branch_upstream_of_another(
-                self.repo,
-                branch.name,
-                other_branch.name,
-            ):
+            if other_branch == branch:
+                continue
+
+            key = (branch_sha, other_branch.commit.hexsha)
+            merged = self._upstream_cache.get(key)
+            if merged is None:
+                merged = is_branch_upstream_of_another(self.repo, branch.name, other_branch.name)
+                self._upstream_cache[key] = merged
+            if merged:
                 return True
 
         return False
@@ -216,18 +310,20 @@ class BranchOperations:
     def get_gone_branches(self) -> List[BranchName]:
         """Get list of branches whose upstream is gone.
 
+        All branches are checked with a single ``git for-each-ref`` call
+        instead of reading the tracking configuration of each branch.
+
         Returns
         -------
         List[BranchName]
             List of branch names
         """
+        output = self.repo.git.for_each_ref("--format=%(refname:lstrip=2)%09%(upstream:track)", "refs/heads")
         gone_branches = []
-        for branch in self.repo.heads:
-            tracking_branch = branch.tracking_branch()
-            if tracking_branch is None:
-                continue
-            if not tracking_branch.is_valid():
-                gone_branches.append(branch.name)
+        for line in output.splitlines():
+            name, _, track = line.partition("\t")
+            if track == "[gone]":
+                gone_branches.append(name)
 
         return gone_branches
 
@@ -262,17 +358,10 @@ class BranchOperations:
         if not protect:
             return to_delete
 
-        protected = set()
-        for branch in to_delete.copy():
-            for pattern in protect:
-                if "*" in pattern:
-                    import fnmatch
-
-                    if fnmatch.fnmatch(branch, pattern):
-                        protected.add(branch)
-                elif branch.startswith(pattern + "-") or branch.startswith(pattern + "/") or branch == pattern:
-                    protected.add(branch)
-        return to_delete - protected
+        # All patterns are compiled into one regex, so each branch is a
+        # single match instead of a check against every pattern
+        protected = compile_protect_patterns(protect)
+        return {branch for branch in to_delete if not protected.match(branch)}
 
     def _delete_branches_interactive(self, to_delete: Set[str], force: bool, no_verify: bool) -> None:
         """Delete branches with interactive confirmation.
@@ -295,6 +384,10 @@ class BranchOperations:
     def _delete_branches_non_interactive(self, to_delete: Set[str], force: bool, no_verify: bool) -> None:
         """Delete branches without confirmation.
 
+        Every branch is verified before anything is deleted. Remote branches
+        are then deleted with one push per remote, followed by all local
+        branches with a single ``git branch -d`` call.
+
         Parameters
         ----------
         to_delete : Set[str]
@@ -303,9 +396,31 @@ class BranchOperations:
             Force deletion even if branch is not merged
         no_verify : bool
             Skip verification checks
+
+        Raises
+        ------
+        GitError
+            If any branch cannot be deleted
         """
-        for branch in sorted(to_delete):
-            self.delete_branch(branch, force=force, no_verify=no_verify)
+        branches = [self._get_deletable_branch(name, force, no_verify) for name in sorted(to_delete)]
+        if not branches:
+            return
+
+        tracked = []
+        for branch in branches:
+            self._validate_not_current_branch(branch)
+            tracking_branch = branch.tracking_branch()
+            if tracking_branch and not force:
+                raise GitError(f"Cannot delete branch '{branch.name}' with remote tracking")
+            if tracking_branch:
+                tracked.append((branch, tracking_branch))
+
+        try:
+            if tracked:
+                self._delete_remote_branches(tracked)
+            delete_branches(self.repo, [branch.name for branch in branches], force)
+        except GitCommandError as err:
+            raise GitError(f"Failed to delete branch: {err}") from err
 
     def clean(
         self,
@@ -338,6 +453,9 @@ class BranchOperations:
         if current_branch in to_delete:
             to_delete.remove(current_branch)
 
+        # Remove branches checked out in other worktrees
+        to_delete -= get_worktree_branches(self.repo).keys()
+
         if not to_delete:
             return
 
@@ -1,9 +1,9 @@
 """Branch status management."""
 
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Set
 
-from git import GitCommandError, Remote, Repo
-from git.refs import Head, RemoteReference
+from git import GitCommandError, Repo
 
 from arborist.errors import GitError
 from arborist.git.common import (
@@ -11,7 +11,6 @@ from arborist.git.common import (
     BranchList,
     BranchName,
     BranchStatus,
-    get_branch,
     log_git_error,
     validate_branch_exists,
     validate_branch_name,
@@ -32,135 +31,92 @@ class BranchStatusManager:
         self.repo = repo
 
     # Remote tracking methods
-    def _get_tracking_branch(self, branch: Head) -> Optional[RemoteReference]:
-        """Get the remote tracking branch for a local branch.
+    def _prune_remotes(self) -> None:
+        """Fetch from every remote, pruning deleted remote-tracking branches.
 
-        Parameters
-        ----------
-        branch : Head
-            The local branch
-
-        Returns
-        -------
-        Optional[RemoteReference]
-            The remote tracking branch, or None if not found
-        """
-        try:
-            return branch.tracking_branch()
-        except (GitCommandError, AttributeError):
-            return None
-
-    def _try_fetch_remote_branch(self, remote: Remote, branch_name: BranchName) -> bool:
-        """Try to fetch a specific branch from a remote.
-
-        Parameters
-        ----------
-        remote : Remote
-            The remote to fetch from
-        branch_name : str
-            The name of the branch to fetch
-
-        Returns
-        -------
-        bool
-            True if the branch exists on the remote, False otherwise
-        """
-        try:
-            remote.fetch(refspec=branch_name)
-            return True
-        except GitCommandError:
-            return False
-
-    def _is_branch_gone(self, branch: Head) -> bool:
-        """Check if a branch is gone.
-
-        Parameters
-        ----------
-        branch : Head
-            Branch to check
-
-        Returns
-        -------
-        bool
-            True if the branch is gone, False otherwise
+        Tags are not fetched because only branch tracking is used. A remote
+        without a fetch refspec has no remote-tracking branches and is
+        skipped. A remote that cannot be reached is logged and skipped,
+        leaving its remote-tracking branches as they were.
         """
-        tracking_branch = self._get_tracking_branch(branch)
-        if not tracking_branch:
-            return False
-
-        # Try to fetch from each remote until we find the branch
         for remote in self.repo.remotes:
-            if self._try_fetch_remote_branch(remote, tracking_branch.remote_head):
-                return False
-
-        return True
-
-    # Branch status methods
-    def _check_branch_merged(self, branch: Head, target: Head) -> bool:
-        """Check if a branch is merged into target.
-
-        Parameters
-        ----------
-        branch : Head
-            Branch to check
-        target : Head
-            Target branch to check against
+            with remote.config_reader as config:
+                has_refspec = config.has_option("fetch")
+            if not has_refspec:
+                continue
+            try:
+                remote.fetch(prune=True, no_tags=True)
+            except GitCommandError as err:
+                log_git_error(err, f"Failed to fetch from remote '{remote.name}'")
+
+    def _get_upstream_tracking(self) -> Dict[BranchName, str]:
+        """Get the upstream tracking state of every local branch.
 
         Returns
         -------
-        bool
-            True if branch is merged into target
+        Dict[str, str]
+            Branch names mapped to git's ``%(upstream:track)`` value, such as
+            ``[gone]`` or ``[ahead 1]``. Empty if the branch is up to date or
+            has no upstream.
         """
-        try:
-            # Get the merge base (common ancestor) of the two branches
-            merge_base = self.repo.merge_base(branch.commit, target.commit)
-            if not merge_base:
-                return False
+        output = self.repo.git.for_each_ref("--format=%(refname:lstrip=2)%09%(upstream:track)", "refs/heads")
+        tracking = {}
+        for line in output.splitlines():
+            name, _, track = line.partition("\t")
+            tracking[name] = track
+        return tracking
 
-            # A branch is merged if its tip is an ancestor of the target branch
-            # AND the merge base is the same as the branch tip
-            return self.repo.is_ancestor(branch.commit, target.commit) and merge_base[0] == branch.commit
-        except GitCommandError:
-            return False
+    # Branch status methods
+    def _get_merged_branch_names(self, target_branch: BranchName) -> Set[BranchName]:
+        """Get the names of all local branches merged into target.
 
-    def _get_branch_status(self, branch: Head, target_branch: BranchName = "main") -> BranchStatus:
-        """Get status of a branch.
+        A branch is merged if its tip is reachable from the target branch. All
+        branches are resolved with a single ``git for-each-ref --merged`` call.
 
         Parameters
         ----------
-        branch : Head
-            Branch to check
         target_branch : str
             Branch to check for merges against
 
         Returns
         -------
-        BranchStatus
-            Status of the branch
+        Set[str]
+            Names of branches merged into target
         """
-        try:
-            # Check if branch is gone
-            if self._is_branch_gone(branch):
-                return BranchStatus.GONE
+        output = self.repo.git.for_each_ref(
+            "--merged",
+            f"refs/heads/{target_branch}",
+            "--format=%(refname:lstrip=2)",
+            "refs/heads",
+        )
+        return set(output.splitlines())
 
-            # Check if branch is merged
-            target = get_branch(self.repo, target_branch)
-            if self._check_branch_merged(branch, target):
-                return BranchStatus.MERGED
+    def _get_pruned_upstream_tracking(self) -> Dict[BranchName, str]:
+        """Prune remotes, then get the upstream tracking state of every branch.
 
-            return BranchStatus.UNMERGED
-        except (GitCommandError, GitError) as err:
-            log_git_error(GitError(str(err)), f"Failed to get status for branch '{branch.name}'")
-            return BranchStatus.UNKNOWN
+        Returns
+        -------
+        Dict[str, str]
+            Every local branch name mapped to its ``%(upstream:track)`` value
+        """
+        self._prune_remotes()
+        return self._get_upstream_tracking()
 
     # Public query methods
-    def get_branch_status(self, target_branch: BranchName = "main") -> BranchDict:
+    def get_branch_status(self, target_branch: BranchName = "main", concurrent: bool = True) -> BranchDict:
         """Get status of all branches.
 
+        The merged and gone checks are independent, so by default they run
+        in parallel and the call takes as long as the slower of the two. When
+        the repository has no remotes there is nothing to fetch, so both are
+        quick local reads and run in the calling thread.
+
         Parameters
         ----------
         target_branch : str
             Branch to check for merges against
+        concurrent : bool
+            Whether to run the merged and gone checks in parallel
 
         Returns
         -------
@@ -175,14 +131,46 @@ class BranchStatusManager:
         try:
             validate_branch_name(target_branch)
             validate_branch_exists(self.repo, target_branch)
-            status = {}
-            for branch in self.repo.heads:
-                status[branch.name] = self._get_branch_status(branch, target_branch)
+            if concurrent and self.repo.remotes:
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    merged_future = executor.submit(self._get_merged_branch_names, target_branch)
+                    tracking_future = executor.submit(self._get_pruned_upstream_tracking)
+                    merged_branches = merged_future.result()
+                    tracking = tracking_future.result()
+            else:
+                merged_branches = self._get_merged_branch_names(target_branch)
+                tracking = self._get_pruned_upstream_tracking()
+
+            # Branch names come from the same for-each-ref snapshot, so no
+            # Head objects need to be built for them. Gone overrides merged.
+            gone_branches = [branch for branch, track in tracking.items() if track == "[gone]"]
+            status = dict.fromkeys(tracking, BranchStatus.UNMERGED)
+            status.update(dict.fromkeys(status.keys() & merged_branches, BranchStatus.MERGED))
+            status.update(dict.fromkeys(gone_branches, BranchStatus.GONE))
             return status
-        except GitError as err:
+        except (GitCommandError, GitError) as err:
             log_git_error(err, f"Failed to get branch status for target '{target_branch}'")
             raise GitError(f"Failed to get branch status: {err}") from err
 
+    def get_branches_with_upstream(self) -> Set[BranchName]:
+        """Get the names of all local branches that have an upstream configured.
+
+        All branches are read with a single ``git for-each-ref`` call, without
+        building a Head or reading the config for each branch.
+
+        Returns
+        -------
+        Set[str]
+            Names of branches with an upstream branch
+        """
+        output = self.repo.git.for_each_ref("--format=%(refname:lstrip=2)%09%(upstream)", "refs/heads")
+        branches = set()
+        for line in output.splitlines():
+            name, _, upstream = line.partition("\t")
+            if upstream:
+                branches.add(name)
+        return branches
+
     def get_gone_branches(self) -> BranchList:
         """Get gone branches.
 
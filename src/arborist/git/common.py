@@ -1,9 +1,11 @@
 """Common git functionality."""
 
+import fnmatch
 import logging
 import re
 from enum import Enum, auto
-from typing import Dict, List, Union
+from functools import lru_cache
+from typing import Dict, Iterable, List, Union
 
 from git import GitCommandError, Repo
 from git.refs import Head
@@ -19,6 +21,11 @@ BranchList = List[str]
 BRANCH_NAME_PATTERN = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9/_.-]*[a-zA-Z0-9]$")
 INVALID_BRANCH_CHARS = {"~", "^", ":", "\\", " ", "*", "?", "[", "]"}
 
+# Characters rejected by validate_branch_name, in the order they are reported
+_INVALID_NAME_CHARS = (" ", "~", "^", ":", "?", "*", "[", "\\")
+_INVALID_NAME_CHARS_RE = re.compile(f"[{re.escape(''.join(_INVALID_NAME_CHARS))}]")
+_CONTROL_CHARS_RE = re.compile(r"[\x00-\x1f\x7f]")
+
 
 class BranchStatus(Enum):
     """Branch status enum."""
@@ -84,9 +91,8 @@ def validate_branch_name(branch_name: BranchName) -> None:
         )
 
     # Check for invalid characters
-    invalid_chars = [" ", "~", "^", ":", "?", "*", "[", "\\"]
-    if any(char in branch_name for char in invalid_chars):
-        found_chars = [char for char in invalid_chars if char in branch_name]
+    if _INVALID_NAME_CHARS_RE.search(branch_name):
+        found_chars = [char for char in _INVALID_NAME_CHARS if char in branch_name]
         raise GitError(
             f"Branch name '{branch_name}' contains invalid characters",
             code=ErrorCode.BRANCH_ERROR,
@@ -94,7 +100,7 @@ def validate_branch_name(branch_name: BranchName) -> None:
         )
 
     # Check for control characters
-    if any(ord(char) < 32 or ord(char) == 127 for char in branch_name):
+    if _CONTROL_CHARS_RE.search(branch_name):
         raise GitError(
             f"Branch name '{branch_name}' contains control characters",
             code=ErrorCode.BRANCH_ERROR,
@@ -118,6 +124,53 @@ def validate_branch_name(branch_name: BranchName) -> None:
         )
 
 
+def compile_protect_patterns(patterns: Iterable[str]) -> re.Pattern[str]:
+    """Compile branch protection patterns into a single regex.
+
+    A branch is protected if it equals a pattern, matches a pattern containing
+    ``*`` as a glob, or starts with a pattern without ``*`` followed by ``-``
+    or ``/`` (so ``main`` protects ``main-1.0``).
+
+    Parameters
+    ----------
+    patterns : Iterable[str]
+        Branch protection patterns
+
+    Returns
+    -------
+    re.Pattern[str]
+        Regex whose ``match`` succeeds for protected branch names
+    """
+    return _compile_protect_patterns(tuple(sorted(set(patterns))))
+
+
+@lru_cache(maxsize=32)
+def _compile_protect_patterns(patterns: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile a normalized tuple of branch protection patterns.
+
+    Parameters
+    ----------
+    patterns : tuple[str, ...]
+        Sorted, unique branch protection patterns
+
+    Returns
+    -------
+    re.Pattern[str]
+        Regex whose ``match`` succeeds for protected branch names
+    """
+    alternatives = []
+    for pattern in patterns:
+        alternatives.append(rf"{re.escape(pattern)}\Z")
+        if "*" in pattern:
+            alternatives.append(fnmatch.translate(pattern))
+        else:
+            alternatives.append(rf"{re.escape(pattern)}[-/]")
+    # An empty alternation would match every branch
+    if not alternatives:
+        return re.compile(r"(?!)")
+    return re.compile("|".join(f"(?:{alternative})" for alternative in alternatives))
+
+
 def validate_branch_exists(repo: Repo, branch_name: BranchName) -> None:
     """Validate that a branch exists.
 
@@ -182,6 +235,55 @@ def get_branch(repo: Repo, branch_name: BranchName) -> Head:
         raise GitError(f"Branch '{branch_name}' does not exist") from err
 
 
+def delete_branches(repo: Repo, branch_names: Iterable[BranchName], force: bool = False) -> None:
+    """Delete local branches with a single ``git branch`` call.
+
+    Branch names are passed after ``--``, so git never reads them as options
+    and they need no escaping.
+
+    Parameters
+    ----------
+    repo : Repo
+        GitPython repository instance
+    branch_names : Iterable[str]
+        Names of the branches to delete
+    force : bool
+        Whether to delete branches that are not fully merged
+
+    Raises
+    ------
+    GitCommandError
+        If git fails to delete any of the branches
+    """
+    repo.git.branch("-D" if force else "-d", "--", *branch_names)
+
+
+def get_worktree_branches(repo: Repo) -> Dict[BranchName, str]:
+    """Get the branches checked out in any worktree of the repository.
+
+    All worktrees are read with a single ``git worktree list --porcelain``
+    call. git refuses to delete a branch checked out in a worktree.
+
+    Parameters
+    ----------
+    repo : Repo
+        GitPython repository instance
+
+    Returns
+    -------
+    Dict[str, str]
+        Branch names mapped to the path of the worktree they are checked out in
+    """
+    branches = {}
+    path = ""
+    for line in repo.git.worktree("list", "--porcelain").splitlines():
+        if line.startswith("worktree "):
+            path = line.removeprefix("worktree ")
+        elif line.startswith("branch refs/heads/"):
+            branches[line.removeprefix("branch refs/heads/")] = path
+    return branches
+
+
 def get_current_branch_name(repo: Repo) -> BranchName:
     """Get the name of the currently checked out branch.
 
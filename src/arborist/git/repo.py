@@ -30,21 +30,29 @@ class GitRepo:
         """
         try:
             self.repo = Repo(path or ".", search_parent_directories=True)
+            # Git messages are matched in English, and none of the queries
+            # need the optional locks git takes to refresh the index
+            self.repo.git.update_environment(LC_ALL="C", GIT_OPTIONAL_LOCKS="0")
             self.branch_status = BranchStatusManager(self.repo)
             self.branch_ops = BranchOperations(self.repo)
-            self.branch_cleanup = BranchCleanup(self.repo)
+            self.branch_cleanup = BranchCleanup(self.repo, self.branch_status)
         except (InvalidGitRepositoryError, NoSuchPathError) as err:
             raise GitError("Not a git repository", code=ErrorCode.REPO_ERROR, details=str(err)) from err
 
-    def get_branch_status(self) -> Dict[str, BranchStatus]:
+    def get_branch_status(self, concurrent: bool = True) -> Dict[str, BranchStatus]:
         """Get the status of all local branches.
 
+        Parameters
+        ----------
+        concurrent : bool
+            Whether to run the merged and gone checks in parallel.
+
         Returns
         -------
         Dict[str, BranchStatus]
             A dictionary mapping branch names to their status.
         """
-        return self.branch_status.get_branch_status()
+        return self.branch_status.get_branch_status(concurrent=concurrent)
 
     def get_merged_branches(self) -> List[str]:
         """Get all merged branches.
@@ -1,58 +1,154 @@
 """Test fixtures and helper functions."""
 
 import os
-import tempfile
+import shutil
 from pathlib import Path
-from typing import Generator
+from typing import Callable, Generator
 
 import pytest
 from git import Repo
+from typer.testing import CliRunner
+
+RepoCopier = Callable[[Path, Path], Repo]
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config: pytest.Config) -> None:
+    """Place temporary test directories on a RAM disk when requested.
+
+    Set ``PYTEST_RAMDISK`` to a directory on a tmpfs mount, for example
+    ``/dev/shm/arborist-pytest``. Like ``--basetemp``, the directory is
+    wiped at the start of each run. An explicit ``--basetemp`` wins.
+
+    Parameters
+    ----------
+    config : pytest.Config
+        Pytest configuration
+    """
+    ramdisk = os.environ.get("PYTEST_RAMDISK")
+    if ramdisk and config.option.basetemp is None:
+        config.option.basetemp = ramdisk
+
+
+def _copy_repo(source_dir: Path, dest_dir: Path) -> Repo:
+    """Copy a repository and its bare remote to a new directory.
+
+    Parameters
+    ----------
+    source_dir : Path
+        Directory containing the ``test_repo`` and ``remote`` repositories
+    dest_dir : Path
+        Directory to copy the repositories into
+
+    Returns
+    -------
+    Repo
+        GitPython repository instance for the copied ``test_repo``
+    """
+    shutil.copytree(source_dir, dest_dir, dirs_exist_ok=True)
+    repo = Repo(dest_dir / "test_repo")
+
+    # Point origin at the copied remote so pushes never touch the source
+    with repo.config_writer() as writer:
+        writer.set_value('remote "origin"', "url", str(dest_dir / "remote"))
+
+    return repo
+
+
+@pytest.fixture(scope="session")
+def copy_repo() -> RepoCopier:
+    """Provide the helper that copies a template repository.
+
+    Returns
+    -------
+    RepoCopier
+        Function copying a repository and its remote into a new directory
+    """
+    return _copy_repo
+
+
+@pytest.fixture(scope="session")
+def cli_runner() -> CliRunner:
+    """Fixture for CLI runner shared across the test session."""
+    return CliRunner(env={"NO_COLOR": "1"})
+
+
+@pytest.fixture(scope="session")
+def template_repo_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create the template git repository with a remote once per session.
+
+    Parameters
+    ----------
+    tmp_path_factory : pytest.TempPathFactory
+        Session-scoped temporary directory factory
+
+    Returns
+    -------
+    Path
+        Directory containing the ``test_repo`` and ``remote`` repositories
+    """
+    # Resolve the real path to handle macOS /private prefix
+    template_dir = tmp_path_factory.mktemp("template").resolve()
+
+    # Initialize local git repository
+    repo_path = template_dir / "test_repo"
+    repo_path.mkdir()
+    repo = Repo.init(repo_path, initial_branch="main")
+
+    # Configure repository and git user in a single config write
+    with repo.config_writer() as writer:
+        writer.set_value("core", "autocrlf", "false")
+        writer.set_value("core", "safecrlf", "true")
+        writer.set_value("core", "filemode", "false")
+        writer.set_value("user", "name", "Test User")
+        writer.set_value("user", "email", "test@example.com")
+        # Test repositories are throwaway, so skip fsyncs and automatic gc
+        writer.set_value("core", "fsync", "none")
+        writer.set_value("gc", "auto", "0")
+        # Keep signing and any globally configured hooks out of git commands
+        writer.set_value("commit", "gpgSign", "false")
+        writer.set_value("core", "hooksPath", os.devnull)
+
+    # Create initial commit on main
+    readme = repo_path / "README.md"
+    readme.write_text("# Test Repository")
+    repo.index.add([str(readme)])
+    repo.index.commit("Initial commit")
+
+    # Create and configure a "remote" repository
+    remote_path = template_dir / "remote"
+    remote_path.mkdir()
+    Repo.init(remote_path, bare=True).close()
+    repo.create_remote("origin", str(remote_path))
+
+    # Push main branch to remote and set upstream tracking
+    repo.git.push("-u", "origin", "main")  # Push and set upstream tracking
+    repo.close()
+
+    return template_dir
 
 
 @pytest.fixture
-def temp_repo() -> Generator[Repo, None, None]:
+def temp_repo(template_repo_dir: Path, copy_repo: RepoCopier, tmp_path: Path) -> Generator[Repo, None, None]:
     """Create a temporary git repository with a remote.
 
+    The repository is copied from a template built once per session, so
+    each test still gets its own isolated repository and remote.
+
+    Parameters
+    ----------
+    template_repo_dir : Path
+        Template repository directory
+    copy_repo : RepoCopier
+        Helper copying a repository and its remote
+    tmp_path : Path
+        Temporary directory path
+
     Yields
     -------
     Repo
         GitPython repository instance
     """
-    # Create a temporary directory
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Resolve the real path to handle macOS /private prefix
-        temp_dir = os.path.realpath(temp_dir)
-
-        # Initialize local git repository
-        repo_path = Path(temp_dir) / "test_repo"
-        repo_path.mkdir()
-        repo = Repo.init(repo_path)  # Initialize without specifying branch
-
-        # Configure repository
-        repo.git.config("core.autocrlf", "false")
-        repo.git.config("core.safecrlf", "true")
-        repo.git.config("core.filemode", "false")
-
-        # Configure git user
-        repo.config_writer().set_value("user", "name", "Test User").release()
-        repo.config_writer().set_value("user", "email", "test@example.com").release()
-
-        # Create and check out main branch
-        repo.git.checkout("-b", "main")
-
-        # Create initial commit on main
-        readme = repo_path / "README.md"
-        readme.write_text("# Test Repository")
-        repo.index.add([str(readme)])
-        repo.index.commit("Initial commit")
-
-        # Create and configure a "remote" repository
-        remote_path = Path(temp_dir) / "remote"
-        remote_path.mkdir()
-        Repo.init(remote_path, bare=True)
-        repo.create_remote("origin", str(remote_path))
-
-        # Push main branch to remote and set upstream tracking
-        repo.git.push("-u", "origin", "main")  # Push and set upstream tracking
-
-        yield repo
+    repo = copy_repo(template_repo_dir, tmp_path)
+    yield repo
+    repo.close()
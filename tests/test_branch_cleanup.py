@@ -1,8 +1,6 @@
 """Tests for branch cleanup operations."""
 
 from pathlib import Path
-from typing import Generator
-from unittest.mock import patch
 
 import pytest
 from git import Repo
@@ -11,44 +9,7 @@ from git.repo.base import Repo as GitRepo
 
 from arborist.errors import GitError
 from arborist.git.branch_cleanup import BranchCleanup
-
-
-@pytest.fixture
-def temp_repo(tmp_path: Path) -> Generator[GitRepo, None, None]:
-    """Create a temporary git repository.
-
-    Parameters
-    ----------
-    tmp_path : Path
-        Temporary directory path
-
-    Yields
-    ------
-    GitRepo
-        Temporary git repository
-    """
-    repo_path = tmp_path / "test_repo"
-    repo_path.mkdir()
-    repo = Repo.init(repo_path, initial_branch="main")
-
-    # Create initial commit on main
-    readme_path = repo_path / "README.md"
-    readme_path.write_text("# Test Repository")
-    repo.index.add(["README.md"])
-    repo.index.commit("Initial commit")
-
-    # Create a remote
-    remote_path = tmp_path / "remote"
-    remote_path.mkdir()
-    remote = Repo.init(remote_path, bare=True)
-    repo.create_remote("origin", str(remote_path))
-    repo.git.push("origin", "HEAD:main")
-
-    yield repo
-
-    # Cleanup
-    repo.close()
-    remote.close()
+from arborist.git.common import BranchStatus
 
 
 @pytest.fixture
@@ -126,7 +87,6 @@ def test_get_branches_to_delete(cleanup_manager: BranchCleanup, temp_repo: GitRe
 
     # 2. Gone branch
     temp_repo.create_head("feature/gone", "HEAD")
-    temp_repo.heads["feature/gone"].checkout()
     temp_repo.git.push("--set-upstream", "origin", "feature/gone")
     temp_repo.git.push("origin", "--delete", "feature/gone")
 
@@ -162,6 +122,26 @@ def test_get_branches_to_delete(cleanup_manager: BranchCleanup, temp_repo: GitRe
     assert "main" not in to_delete
 
 
+def test_get_branches_to_delete_skips_worktree_branches(
+    cleanup_manager: BranchCleanup, temp_repo: GitRepo, tmp_path: Path
+) -> None:
+    """Test that branches checked out in other worktrees are not deleted.
+
+    Parameters
+    ----------
+    cleanup_manager : BranchCleanup
+        Branch cleanup manager instance
+    temp_repo : GitRepo
+        Temporary git repository
+    tmp_path : Path
+        Temporary directory path
+    """
+    temp_repo.create_head("feature/merged", "HEAD")
+    temp_repo.git.worktree("add", "-b", "feature/worktree", str(tmp_path / "worktree"))
+
+    assert cleanup_manager._get_branches_to_delete(force=False) == ["feature/merged"]
+
+
 def test_validate_branch_exists(cleanup_manager: BranchCleanup, temp_repo: GitRepo) -> None:
     """Test branch existence validation.
 
@@ -202,6 +182,11 @@ def test_validate_not_current_branch(cleanup_manager: BranchCleanup, temp_repo:
     # Test different branch
     cleanup_manager._validate_not_current_branch("main")
 
+    # Test with a precomputed current branch name
+    with pytest.raises(GitError):
+        cleanup_manager._validate_not_current_branch("main", current="main")
+    cleanup_manager._validate_not_current_branch("feature/test", current="main")
+
 
 def test_validate_branch_merged(cleanup_manager: BranchCleanup, temp_repo: GitRepo) -> None:
     """Test branch merge status validation.
@@ -325,6 +310,39 @@ def test_perform_branch_deletion(cleanup_manager: BranchCleanup, temp_repo: GitR
     assert "Failed to delete branch" in message
 
 
+def test_perform_batch_deletion(cleanup_manager: BranchCleanup, temp_repo: GitRepo) -> None:
+    """Test deleting several branches with one git call.
+
+    Parameters
+    ----------
+    cleanup_manager : BranchCleanup
+        Branch cleanup manager instance
+    temp_repo : GitRepo
+        Temporary git repository
+    """
+    # Create two merged branches and one unmerged branch
+    temp_repo.create_head("feature/one", "HEAD")
+    temp_repo.create_head("feature/two", "HEAD")
+    temp_repo.create_head("feature/unmerged", "HEAD").checkout()
+    test_file = Path(temp_repo.working_dir) / "unmerged.txt"
+    test_file.write_text("unmerged")
+    temp_repo.index.add([str(test_file)])
+    temp_repo.index.commit("Unmerged commit")
+    temp_repo.heads.main.checkout()
+
+    # Merged branches are deleted even though git refuses the unmerged one
+    deleted, failed = cleanup_manager._perform_batch_deletion(
+        ["feature/one", "feature/unmerged", "feature/two"], force=False
+    )
+    assert deleted == ["feature/one", "feature/two"]
+    assert failed == [("feature/unmerged", "Branch has unmerged changes. Use --force to delete anyway")]
+    assert "feature/one" not in temp_repo.heads
+    assert "feature/unmerged" in temp_repo.heads
+
+    # Nothing to delete is a no-op
+    assert cleanup_manager._perform_batch_deletion([], force=False) == ([], [])
+
+
 def test_delete_single_branch(cleanup_manager: BranchCleanup, temp_repo: GitRepo) -> None:
     """Test single branch deletion.
 
@@ -430,7 +448,65 @@ def test_clean_with_errors(cleanup_manager: BranchCleanup, temp_repo: GitRepo) -
     assert "feature/test" in temp_repo.heads  # Should not delete current branch
 
 
-def test_switch_to_safe_branch_error(temp_repo: Repo):
+def test_clean_gets_branch_status_once(
+    cleanup_manager: BranchCleanup, temp_repo: GitRepo, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a clean run looks up branch status only once.
+
+    Parameters
+    ----------
+    cleanup_manager : BranchCleanup
+        Branch cleanup manager instance
+    temp_repo : GitRepo
+        Temporary git repository
+    monkeypatch : pytest.MonkeyPatch
+        Pytest monkeypatch fixture
+    """
+    temp_repo.create_head("feature/merged", "HEAD")
+
+    calls = []
+    get_branch_status = cleanup_manager.status_manager.get_branch_status
+
+    def counting_get_branch_status() -> dict[str, BranchStatus]:
+        calls.append(True)
+        return get_branch_status()
+
+    monkeypatch.setattr(cleanup_manager.status_manager, "get_branch_status", counting_get_branch_status)
+
+    cleanup_manager.clean(no_interactive=True)
+    assert "feature/merged" not in temp_repo.heads
+    assert len(calls) == 1
+
+
+def test_delete_branch_sees_later_remote_deletion(cleanup_manager: BranchCleanup, temp_repo: GitRepo) -> None:
+    """Test that delete_branch detects an upstream deleted after an earlier status query.
+
+    Parameters
+    ----------
+    cleanup_manager : BranchCleanup
+        Branch cleanup manager instance
+    temp_repo : GitRepo
+        Temporary git repository
+    """
+    # Create an unmerged branch with an upstream
+    temp_repo.create_head("feature/gone", "HEAD").checkout()
+    test_file = Path(temp_repo.working_dir) / "gone.txt"
+    test_file.write_text("test")
+    temp_repo.index.add(["gone.txt"])
+    temp_repo.index.commit("Gone branch commit")
+    temp_repo.git.push("--set-upstream", "origin", "feature/gone")
+    temp_repo.heads.main.checkout()
+    assert cleanup_manager.status_manager.get_branch_status()["feature/gone"] == BranchStatus.UNMERGED
+
+    # Delete the branch in the remote itself
+    with Repo(temp_repo.remotes.origin.url) as remote:
+        remote.git.branch("-D", "feature/gone")
+
+    cleanup_manager.delete_branch("feature/gone")
+    assert "feature/gone" not in temp_repo.heads
+
+
+def test_switch_to_safe_branch_error(temp_repo: Repo, monkeypatch: pytest.MonkeyPatch):
     """Test error handling when switching to a safe branch fails."""
     cleanup = BranchCleanup(temp_repo)
 
@@ -443,13 +519,16 @@ def test_switch_to_safe_branch_error(temp_repo: Repo):
     temp_repo.create_head(to_delete)
     temp_repo.heads[to_delete].checkout()  # Switch to the branch we want to delete
 
-    # Mock _find_safe_branch to return our safe branch
-    with patch.object(cleanup, "_find_safe_branch", return_value=safe_branch):
-        # Mock GitCommandError when trying to switch
-        with patch("git.refs.head.Head.checkout", side_effect=GitCommandError("git checkout", 1)):
-            success, error = cleanup._switch_to_safe_branch(to_delete, {to_delete})
-            assert not success
-            assert "Failed to switch to branch 'safe-branch'" in error
+    def fail_checkout(*args, **kwargs):
+        raise GitCommandError("git checkout", 1)
+
+    # Return our safe branch and make switching to it fail
+    monkeypatch.setattr(cleanup, "_find_safe_branch", lambda *args: safe_branch)
+    monkeypatch.setattr("git.refs.head.Head.checkout", fail_checkout)
+
+    success, error = cleanup._switch_to_safe_branch(to_delete, {to_delete})
+    assert not success
+    assert "Failed to switch to branch 'safe-branch'" in error
 
 
 def test_clean_dry_run_no_branches(temp_repo: Repo):
@@ -1,272 +1,259 @@
 """Tests for branch operations."""
 
 import logging
-import os
 from pathlib import Path
-from typing import Generator
 
 import pytest
 from arborist.errors import ErrorCode, GitError
 from arborist.git.branch_operations import BranchOperations
+from arborist.git.common import delete_branches, is_branch_upstream_of_another
+from git import Git, Repo
 from git.repo.base import Repo as GitRepo
 
 logger = logging.getLogger(__name__)
 
 
-@pytest.fixture
-def test_repo(temp_repo: GitRepo) -> Generator[GitRepo, None, None]:
-    """Create a test repository.
-
-    Parameters
-    ----------
-    temp_repo : GitRepo
-        Temporary repository from conftest.py
-
-    Yields
-    ------
-    GitRepo
-        Test repository
-    """
-    # Change working directory to repo
-    old_cwd = os.getcwd()
-    os.chdir(temp_repo.working_dir)
-
-    yield temp_repo
-
-    # Restore working directory
-    os.chdir(old_cwd)
-
-
-def test_validate_not_current_branch(test_repo: GitRepo) -> None:
+def test_validate_not_current_branch(temp_repo: GitRepo) -> None:
     """Test validation of non-current branch.
 
     Parameters
     ----------
-    test_repo : GitRepo
+    temp_repo : GitRepo
         Test repository
     """
-    branch_ops = BranchOperations(test_repo)
+    branch_ops = BranchOperations(temp_repo)
 
     # Create a test branch
-    test_repo.create_head("feature/test")
+    temp_repo.create_head("feature/test")
 
     # Should not raise for non-current branch
-    branch_ops._validate_not_current_branch(test_repo.heads["feature/test"])
+    branch_ops._validate_not_current_branch(temp_repo.heads["feature/test"])
 
     # Should raise for current branch
     with pytest.raises(GitError, match="Cannot delete current branch 'main'"):
-        branch_ops._validate_not_current_branch(test_repo.heads["main"])
+        branch_ops._validate_not_current_branch(temp_repo.heads["main"])
 
 
-def test_validate_not_protected(test_repo: GitRepo) -> None:
+def test_validate_not_protected(temp_repo: GitRepo) -> None:
     """Test validation of non-protected branch.
 
     Parameters
     ----------
-    test_repo : GitRepo
+    temp_repo : GitRepo
         Test repository
     """
-    branch_ops = BranchOperations(test_repo)
+    branch_ops = BranchOperations(temp_repo)
 
     # Create test branches
-    test_repo.create_head("feature/test")
-    test_repo.create_head("release/1.0")
-    test_repo.create_head("release/1.0-hotfix")
-    test_repo.create_head("main-1.0")
+    temp_repo.create_head("feature/test")
+    temp_repo.create_head("release/1.0")
+    temp_repo.create_head("release/1.0-hotfix")
+    temp_repo.create_head("main-1.0")
 
     # Should not raise for unprotected branch
-    branch_ops._validate_not_protected(test_repo.heads["feature/test"], ["release/*", "main"])
+    branch_ops._validate_not_protected(temp_repo.heads["feature/test"], ["release/*", "main"])
 
     # Should raise for exact match
     with pytest.raises(GitError, match="Cannot delete protected branch 'main'"):
-        branch_ops._validate_not_protected(test_repo.heads["main"], ["main"])
+        branch_ops._validate_not_protected(temp_repo.heads["main"], ["main"])
 
     # Should raise for pattern match
     with pytest.raises(GitError, match="Cannot delete protected branch 'release/1.0'"):
-        branch_ops._validate_not_protected(test_repo.heads["release/1.0"], ["release/*"])
+        branch_ops._validate_not_protected(temp_repo.heads["release/1.0"], ["release/*"])
 
     # Should raise for prefix match
     with pytest.raises(GitError, match="Cannot delete protected branch 'main-1.0'"):
-        branch_ops._validate_not_protected(test_repo.heads["main-1.0"], ["main"])
+        branch_ops._validate_not_protected(temp_repo.heads["main-1.0"], ["main"])
 
 
-def test_delete_branch_safely(test_repo: GitRepo) -> None:
+def test_delete_branch_safely(temp_repo: GitRepo) -> None:
     """Test safe branch deletion.
 
     Parameters
     ----------
-    test_repo : GitRepo
+    temp_repo : GitRepo
         Test repository
     """
-    branch_ops = BranchOperations(test_repo)
+    branch_ops = BranchOperations(temp_repo)
 
     # Create test branches
-    test_repo.create_head("feature/test")
-    test_repo.create_head("release/1.0")
+    temp_repo.create_head("feature/test")
+    temp_repo.create_head("release/1.0")
 
     # Should delete unprotected branch
-    branch_ops._delete_branch_safely(test_repo.heads["feature/test"])
-    assert "feature/test" not in test_repo.heads
+    branch_ops._delete_branch_safely(temp_repo.heads["feature/test"])
+    assert "feature/test" not in temp_repo.heads
 
     # Should not delete current branch
     with pytest.raises(GitError, match="Cannot delete current branch 'main'"):
-        branch_ops._delete_branch_safely(test_repo.heads["main"])
-    assert "main" in test_repo.heads
+        branch_ops._delete_branch_safely(temp_repo.heads["main"])
+    assert "main" in temp_repo.heads
 
 
-def test_delete_branch(test_repo: GitRepo) -> None:
+def test_delete_branch(temp_repo: GitRepo) -> None:
     """Test branch deletion.
 
     Parameters
     ----------
-    test_repo : GitRepo
+    temp_repo : GitRepo
         Test repository
     """
-    branch_ops = BranchOperations(test_repo)
+    branch_ops = BranchOperations(temp_repo)
 
     # Create test branches
-    test_repo.create_head("feature/test")
-    test_repo.create_head("release/1.0")
+    temp_repo.create_head("feature/test")
+    temp_repo.create_head("release/1.0")
 
     # Should delete unprotected branch
     branch_ops.delete_branch("feature/test")
-    assert "feature/test" not in test_repo.heads
+    assert "feature/test" not in temp_repo.heads
 
     # Should not delete protected branch
     with pytest.raises(GitError, match="Cannot delete protected branch 'release/1.0'"):
         branch_ops.delete_branch("release/1.0", protected_branches=["release/*"])
-    assert "release/1.0" in test_repo.heads
+    assert "release/1.0" in temp_repo.heads
 
     # Should not delete current branch
     with pytest.raises(GitError, match="Cannot delete current branch 'main'"):
         branch_ops.delete_branch("main")
-    assert "main" in test_repo.heads
+    assert "main" in temp_repo.heads
 
 
-def test_branch_operations_with_remote(test_repo: GitRepo) -> None:
+def test_branch_operations_with_remote(temp_repo: GitRepo) -> None:
     """Test branch operations with remote tracking.
 
     Parameters
     ----------
-    test_repo : GitRepo
+    temp_repo : GitRepo
         Test repository
     """
-    branch_ops = BranchOperations(test_repo)
+    branch_ops = BranchOperations(temp_repo)
 
     # Create and push test branch
-    test_repo.create_head("feature/remote")
-    test_repo.git.push("--set-upstream", "origin", "feature/remote")
+    temp_repo.create_head("feature/remote")
+    temp_repo.git.push("--set-upstream", "origin", "feature/remote")
 
     # Should delete branch with remote tracking when forced
     branch_ops.delete_branch("feature/remote", force=True)
-    assert "feature/remote" not in test_repo.heads
+    assert "feature/remote" not in temp_repo.heads
+    assert "origin/feature/remote" not in [ref.name for ref in temp_repo.remotes.origin.refs]
+
+    # A remote branch that is already gone leaves no stale tracking ref behind
+    temp_repo.create_head("feature/stale")
+    temp_repo.git.push("--set-upstream", "origin", "feature/stale")
+    with Repo(temp_repo.remotes.origin.url) as remote:
+        remote.git.branch("-D", "feature/stale")
+
+    branch_ops.delete_branch("feature/stale", force=True)
+    assert "feature/stale" not in temp_repo.heads
+    assert "origin/feature/stale" not in [ref.name for ref in temp_repo.remotes.origin.refs]
 
 
-def test_branch_operations_with_changes(test_repo: GitRepo) -> None:
+def test_branch_operations_with_changes(temp_repo: GitRepo) -> None:
     """Test branch operations with uncommitted changes.
 
     Parameters
     ----------
-    test_repo : GitRepo
+    temp_repo : GitRepo
         Test repository
     """
-    branch_ops = BranchOperations(test_repo)
+    branch_ops = BranchOperations(temp_repo)
 
     # Create test branch with uncommitted changes
-    test_repo.create_head("feature/changes")
-    test_repo.heads["feature/changes"].checkout()
+    temp_repo.create_head("feature/changes")
+    temp_repo.heads["feature/changes"].checkout()
 
     # Create an uncommitted change
-    changes_file = Path(test_repo.working_dir) / "changes.txt"
+    changes_file = Path(temp_repo.working_dir) / "changes.txt"
     changes_file.write_text("Uncommitted changes")
-    test_repo.index.add([str(changes_file)])
+    temp_repo.index.add([str(changes_file)])
 
     # Switch back to main
-    test_repo.heads["main"].checkout()
+    temp_repo.heads["main"].checkout()
 
     # Should delete branch with uncommitted changes when forced
     branch_ops.delete_branch("feature/changes", force=True)
-    assert "feature/changes" not in test_repo.heads
+    assert "feature/changes" not in temp_repo.heads
 
 
-def test_delete_branch_safely_with_errors(test_repo: GitRepo) -> None:
+def test_delete_branch_safely_with_errors(temp_repo: GitRepo) -> None:
     """Test error handling in safe branch deletion.
 
     Parameters
     ----------
-    test_repo : GitRepo
+    temp_repo : GitRepo
         Test repository
     """
-    branch_ops = BranchOperations(test_repo)
+    branch_ops = BranchOperations(temp_repo)
 
     # Create test branches
-    test_repo.create_head("feature/test")
-    test_repo.create_head("feature/changes")
+    temp_repo.create_head("feature/test")
+    temp_repo.create_head("feature/changes")
 
     # Create changes in feature/changes branch
-    test_repo.heads["feature/changes"].checkout()
-    changes_file = Path(test_repo.working_dir) / "changes.txt"
+    temp_repo.heads["feature/changes"].checkout()
+    changes_file = Path(temp_repo.working_dir) / "changes.txt"
     changes_file.write_text("Uncommitted changes")
-    test_repo.index.add([str(changes_file)])
-    test_repo.index.commit("Add changes")
+    temp_repo.index.add([str(changes_file)])
+    temp_repo.index.commit("Add changes")
 
     # Create another change but don't commit it
     changes_file.write_text("More uncommitted changes")
-    test_repo.index.add([str(changes_file)])
+    temp_repo.index.add([str(changes_file)])
 
     # Should raise when trying to delete branch with changes
     with pytest.raises(GitError, match="Cannot delete current branch 'feature/changes'"):
-        branch_ops._delete_branch_safely(test_repo.heads["feature/changes"])
+        branch_ops._delete_branch_safely(temp_repo.heads["feature/changes"])
 
     # Switch back to main
-    test_repo.git.stash("save")
-    test_repo.heads["main"].checkout()
+    temp_repo.git.stash("save")
+    temp_repo.heads["main"].checkout()
 
     # Should raise when trying to delete unmerged branch
     with pytest.raises(GitError, match="Failed to delete branch"):
-        branch_ops._delete_branch_safely(test_repo.heads["feature/changes"])
+        branch_ops._delete_branch_safely(temp_repo.heads["feature/changes"])
 
     # Create and push test branch
-    test_repo.create_head("feature/remote")
-    test_repo.git.push("--set-upstream", "origin", "feature/remote")
+    temp_repo.create_head("feature/remote")
+    temp_repo.git.push("--set-upstream", "origin", "feature/remote")
 
     # Should raise when trying to delete branch with remote tracking
     with pytest.raises(GitError, match="Cannot delete branch 'feature/remote' with remote tracking"):
-        branch_ops._delete_branch_safely(test_repo.heads["feature/remote"])
+        branch_ops._delete_branch_safely(temp_repo.heads["feature/remote"])
 
     # Should delete unprotected branch
-    branch_ops._delete_branch_safely(test_repo.heads["feature/test"])
-    assert "feature/test" not in test_repo.heads
+    branch_ops._delete_branch_safely(temp_repo.heads["feature/test"])
+    assert "feature/test" not in temp_repo.heads
 
 
-def test_is_branch_merged(test_repo: GitRepo) -> None:
+def test_is_branch_merged(temp_repo: GitRepo) -> None:
     """Test branch merge status checking.
 
     Parameters
     ----------
-    test_repo : GitRepo
+    temp_repo : GitRepo
         Test repository
     """
-    branch_ops = BranchOperations(test_repo)
+    branch_ops = BranchOperations(temp_repo)
 
     # Create and merge a branch
-    merged_branch = test_repo.create_head("feature/merged")
+    merged_branch = temp_repo.create_head("feature/merged")
     merged_branch.checkout()
-    test_file = Path(test_repo.working_dir) / "merged.txt"
+    test_file = Path(temp_repo.working_dir) / "merged.txt"
     test_file.write_text("merged branch content")
-    test_repo.index.add([str(test_file)])
-    test_repo.index.commit("Commit on merged branch")
-    test_repo.heads["main"].checkout()
-    test_repo.git.merge("feature/merged")
+    temp_repo.index.add([str(test_file)])
+    temp_repo.index.commit("Commit on merged branch")
+    temp_repo.heads["main"].checkout()
+    temp_repo.git.merge("feature/merged")
 
     # Create an unmerged branch
-    unmerged_branch = test_repo.create_head("feature/unmerged")
+    unmerged_branch = temp_repo.create_head("feature/unmerged")
     unmerged_branch.checkout()
-    test_file = Path(test_repo.working_dir) / "unmerged.txt"
+    test_file = Path(temp_repo.working_dir) / "unmerged.txt"
     test_file.write_text("unmerged branch content")
-    test_repo.index.add([str(test_file)])
-    test_repo.index.commit("Commit on unmerged branch")
-    test_repo.heads["main"].checkout()
+    temp_repo.index.add([str(test_file)])
+    temp_repo.index.commit("Commit on unmerged branch")
+    temp_repo.heads["main"].checkout()
 
     # Test merged branch
     assert branch_ops._is_branch_merged(merged_branch) is True
@@ -275,28 +262,70 @@ def test_is_branch_merged(test_repo: GitRepo) -> None:
     assert branch_ops._is_branch_merged(unmerged_branch) is False
 
 
-def test_get_merged_branches_with_remote(test_repo: GitRepo) -> None:
+def test_is_branch_merged_caches_results(temp_repo: GitRepo, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that ancestry checks are cached by commit SHA.
+
+    Parameters
+    ----------
+    temp_repo : GitRepo
+        Test repository
+    monkeypatch : pytest.MonkeyPatch
+        Pytest monkeypatch fixture
+    """
+    branch_ops = BranchOperations(temp_repo)
+    branch = temp_repo.create_head("feature/cached")
+    temp_repo.create_head("feature/other")
+
+    calls = []
+
+    def counting_check(repo: GitRepo, upstream: str, downstream: str) -> bool:
+        calls.append((upstream, downstream))
+        return is_branch_upstream_of_another(repo, upstream, downstream)
+
+    monkeypatch.setattr("arborist.git.branch_operations.is_branch_upstream_of_another", counting_check)
+
+    assert branch_ops._is_branch_merged(branch) is True
+    first_calls = len(calls)
+    assert first_calls > 0
+
+    # Same tips, so the cached result is reused
+    assert branch_ops._is_branch_merged(branch) is True
+    assert len(calls) == first_calls
+
+    # Moving the branch changes its SHA, so it is checked again
+    branch.checkout()
+    test_file = Path(temp_repo.working_dir) / "cached.txt"
+    test_file.write_text("cached branch content")
+    temp_repo.index.add([str(test_file)])
+    temp_repo.index.commit("Commit on cached branch")
+    temp_repo.heads["main"].checkout()
+
+    assert branch_ops._is_branch_merged(branch) is False
+    assert len(calls) > first_calls
+
+
+def test_get_merged_branches_with_remote(temp_repo: GitRepo) -> None:
     """Test getting merged branches with remote parameter.
 
     Parameters
     ----------
-    test_repo : GitRepo
+    temp_repo : GitRepo
         Test repository
     """
-    branch_ops = BranchOperations(test_repo)
+    branch_ops = BranchOperations(temp_repo)
 
     # Create and merge a branch
-    merged_branch = test_repo.create_head("feature/merged")
+    merged_branch = temp_repo.create_head("feature/merged")
     merged_branch.checkout()
-    test_file = Path(test_repo.working_dir) / "merged.txt"
+    test_file = Path(temp_repo.working_dir) / "merged.txt"
     test_file.write_text("merged branch content")
-    test_repo.index.add([str(test_file)])
-    test_repo.index.commit("Commit on merged branch")
-    test_repo.heads["main"].checkout()
-    test_repo.git.merge("feature/merged")
+    temp_repo.index.add([str(test_file)])
+    temp_repo.index.commit("Commit on merged branch")
+    temp_repo.heads["main"].checkout()
+    temp_repo.git.merge("feature/merged")
 
     # Get remote
-    remote = test_repo.remote()
+    remote = temp_repo.remote()
 
     # Test with remote parameter
     merged_branches = branch_ops.get_merged_branches(remote=remote)
@@ -304,20 +333,38 @@ def test_get_merged_branches_with_remote(test_repo: GitRepo) -> None:
     assert "main" not in merged_branches
 
 
-def test_branch_protection_patterns(test_repo: GitRepo) -> None:
+def test_get_gone_branches(temp_repo: GitRepo) -> None:
+    """Test that only branches with a deleted upstream are gone.
+
+    Parameters
+    ----------
+    temp_repo : GitRepo
+        Test repository
+    """
+    branch_ops = BranchOperations(temp_repo)
+    temp_repo.create_head("feature/gone")
+    temp_repo.create_head("feature/tracked")
+    temp_repo.create_head("feature/local")
+    temp_repo.git.push("--set-upstream", "origin", "feature/gone", "feature/tracked")
+    temp_repo.git.push("origin", "--delete", "feature/gone")
+
+    assert branch_ops.get_gone_branches() == ["feature/gone"]
+
+
+def test_branch_protection_patterns(temp_repo: GitRepo) -> None:
     """Test branch protection patterns.
 
     Parameters
     ----------
-    test_repo : GitRepo
+    temp_repo : GitRepo
         Test repository
     """
-    branch_ops = BranchOperations(test_repo)
+    branch_ops = BranchOperations(temp_repo)
 
     # Create test branches
-    test_repo.create_head("release/1.0")
-    test_repo.create_head("release-candidate")
-    test_repo.create_head("feature/test")
+    temp_repo.create_head("release/1.0")
+    temp_repo.create_head("release-candidate")
+    temp_repo.create_head("feature/test")
 
     # Test wildcard pattern
     with pytest.raises(GitError, match="Cannot delete protected branch 'release/1.0'"):
@@ -331,89 +378,77 @@ def test_branch_protection_patterns(test_repo: GitRepo) -> None:
     branch_ops.delete_branch("feature/test", protected_branches=["release/*", "main"])
 
 
-def test_delete_branch_rejects_double_slashes(test_repo: GitRepo) -> None:
-    """Test that branch deletion rejects names with double slashes.
-
-    Parameters
-    ----------
-    test_repo : GitRepo
-        Test repository
-    """
-    branch_ops = BranchOperations(test_repo)
-    invalid_name = "invalid//branch"
-
-    with pytest.raises(GitError) as excinfo:
-        branch_ops.delete_branch(invalid_name)
-
-    error = excinfo.value
-    assert error.code == ErrorCode.BRANCH_ERROR, "Should use BRANCH_ERROR code"
-    assert f"Branch name '{invalid_name}' contains double slashes" == str(error), "Error message should be descriptive"
-    assert "consecutive forward slashes" in error.details, "Details should explain the issue"
-
-
-def test_delete_branch_rejects_special_characters(test_repo: GitRepo) -> None:
-    """Test that branch deletion rejects names with special characters.
+def test_remove_protected_branches(temp_repo: GitRepo) -> None:
+    """Test filtering protected branches out of the deletion set.
 
     Parameters
     ----------
-    test_repo : GitRepo
+    temp_repo : GitRepo
         Test repository
     """
-    branch_ops = BranchOperations(test_repo)
-    invalid_name = "invalid branch"
+    branch_ops = BranchOperations(temp_repo)
+    to_delete = {"main", "develop", "release/1.0", "release-candidate", "feature/test"}
 
-    with pytest.raises(GitError) as excinfo:
-        branch_ops.delete_branch(invalid_name)
+    remaining = branch_ops._remove_protected_branches(to_delete, {"main", "release", "dev*"})
+    assert remaining == {"feature/test"}
 
-    error = excinfo.value
-    assert error.code == ErrorCode.BRANCH_ERROR, "Should use BRANCH_ERROR code"
-    assert f"Branch name '{invalid_name}' contains invalid characters" == str(
-        error
-    ), "Error message should be descriptive"
-    assert "' '" in error.details, "Details should list the invalid character"
+    # Nothing is removed without protection patterns
+    assert branch_ops._remove_protected_branches(to_delete, None) == to_delete
 
 
-def test_delete_branch_rejects_control_characters(test_repo: GitRepo) -> None:
-    """Test that branch deletion rejects names with control characters.
+@pytest.mark.parametrize(
+    ("invalid_name", "problem", "detail"),
+    [
+        ("invalid//branch", "double slashes", "consecutive forward slashes"),
+        ("invalid branch", "invalid characters", "' '"),
+        ("invalid\nbranch", "control characters", "control characters"),
+    ],
+    ids=["double-slashes", "special-characters", "control-characters"],
+)
+def test_delete_branch_rejects_invalid_names(temp_repo: GitRepo, invalid_name: str, problem: str, detail: str) -> None:
+    """Test that branch deletion rejects invalid branch names.
 
     Parameters
     ----------
-    test_repo : GitRepo
+    temp_repo : GitRepo
         Test repository
+    invalid_name : str
+        Branch name that should be rejected
+    problem : str
+        Problem named in the error message
+    detail : str
+        Text expected in the error details
     """
-    branch_ops = BranchOperations(test_repo)
-    invalid_name = "invalid\nbranch"
+    branch_ops = BranchOperations(temp_repo)
 
     with pytest.raises(GitError) as excinfo:
         branch_ops.delete_branch(invalid_name)
 
     error = excinfo.value
     assert error.code == ErrorCode.BRANCH_ERROR, "Should use BRANCH_ERROR code"
-    assert f"Branch name '{invalid_name}' contains control characters" == str(
-        error
-    ), "Error message should be descriptive"
-    assert "control characters" in error.details, "Details should explain the issue"
-    assert invalid_name not in test_repo.heads, "Branch with control characters should not exist"
+    assert f"Branch name '{invalid_name}' contains {problem}" == str(error), "Error message should be descriptive"
+    assert detail in error.details, "Details should explain the issue"
+    assert invalid_name not in temp_repo.heads, "Invalid branch should not exist"
 
 
-def test_delete_branch_requires_force_for_unmerged(test_repo: GitRepo) -> None:
+def test_delete_branch_requires_force_for_unmerged(temp_repo: GitRepo) -> None:
     """Test that unmerged branches require force flag for deletion.
 
     Parameters
     ----------
-    test_repo : GitRepo
+    temp_repo : GitRepo
         Test repository
     """
-    branch_ops = BranchOperations(test_repo)
+    branch_ops = BranchOperations(temp_repo)
 
     # Create an unmerged branch
-    unmerged = test_repo.create_head("feature/unmerged")
+    unmerged = temp_repo.create_head("feature/unmerged")
     unmerged.checkout()
-    test_file = Path(test_repo.working_dir) / "unmerged.txt"
+    test_file = Path(temp_repo.working_dir) / "unmerged.txt"
     test_file.write_text("unmerged content")
-    test_repo.index.add([str(test_file)])
-    test_repo.index.commit("Commit on unmerged branch")
-    test_repo.heads["main"].checkout()
+    temp_repo.index.add([str(test_file)])
+    temp_repo.index.commit("Commit on unmerged branch")
+    temp_repo.heads["main"].checkout()
 
     with pytest.raises(GitError) as excinfo:
         branch_ops.delete_branch("feature/unmerged")
@@ -423,52 +458,159 @@ def test_delete_branch_requires_force_for_unmerged(test_repo: GitRepo) -> None:
     assert (
         str(error) == "Branch 'feature/unmerged' is not fully merged"
     ), "Error message should indicate unmerged branch"
-    assert "feature/unmerged" in test_repo.heads, "Unmerged branch should still exist"
+    assert "feature/unmerged" in temp_repo.heads, "Unmerged branch should still exist"
 
 
-def test_clean_with_various_options(test_repo: GitRepo) -> None:
+def test_clean_with_various_options(temp_repo: GitRepo) -> None:
     """Test clean method with various options.
 
     Parameters
     ----------
-    test_repo : GitRepo
+    temp_repo : GitRepo
         Test repository
     """
-    branch_ops = BranchOperations(test_repo)
+    branch_ops = BranchOperations(temp_repo)
 
     # Create and merge a branch
-    merged = test_repo.create_head("feature/merged")
+    merged = temp_repo.create_head("feature/merged")
     merged.checkout()
-    test_file = Path(test_repo.working_dir) / "merged.txt"
+    test_file = Path(temp_repo.working_dir) / "merged.txt"
     test_file.write_text("merged content")
-    test_repo.index.add([str(test_file)])
-    test_repo.index.commit("Commit on merged branch")
-    test_repo.heads["main"].checkout()
-    test_repo.git.merge("feature/merged")
+    temp_repo.index.add([str(test_file)])
+    temp_repo.index.commit("Commit on merged branch")
+    temp_repo.heads["main"].checkout()
+    temp_repo.git.merge("feature/merged")
 
     # Create a branch with gone remote
-    gone = test_repo.create_head("feature/gone")
+    gone = temp_repo.create_head("feature/gone")
     gone.checkout()
-    test_file = Path(test_repo.working_dir) / "gone.txt"
+    test_file = Path(temp_repo.working_dir) / "gone.txt"
     test_file.write_text("gone content")
-    test_repo.index.add([str(test_file)])
-    test_repo.index.commit("Commit on gone branch")
+    temp_repo.index.add([str(test_file)])
+    temp_repo.index.commit("Commit on gone branch")
     # Push to remote and then delete remote branch to make it "gone"
-    test_repo.git.push("--set-upstream", "origin", "feature/gone")
-    test_repo.git.push("origin", "--delete", "feature/gone")
-    test_repo.heads["main"].checkout()
+    temp_repo.git.push("--set-upstream", "origin", "feature/gone")
+    temp_repo.git.push("origin", "--delete", "feature/gone")
+    temp_repo.heads["main"].checkout()
 
     # Test clean with dry run
     branch_ops.clean(dry_run=True)
-    assert "feature/merged" in [b.name for b in test_repo.heads]
-    assert "feature/gone" in [b.name for b in test_repo.heads]
+    assert "feature/merged" in [b.name for b in temp_repo.heads]
+    assert "feature/gone" in [b.name for b in temp_repo.heads]
 
     # Test clean with protection
     branch_ops.clean(protect={"feature/*"}, no_interactive=True)
-    assert "feature/merged" in [b.name for b in test_repo.heads]
-    assert "feature/gone" in [b.name for b in test_repo.heads]
+    assert "feature/merged" in [b.name for b in temp_repo.heads]
+    assert "feature/gone" in [b.name for b in temp_repo.heads]
 
     # Test clean with force and no verification
     branch_ops.clean(force=True, no_verify=True, no_interactive=True)
-    assert "feature/merged" not in [b.name for b in test_repo.heads]
-    assert "feature/gone" not in [b.name for b in test_repo.heads]
+    assert "feature/merged" not in [b.name for b in temp_repo.heads]
+    assert "feature/gone" not in [b.name for b in temp_repo.heads]
+
+
+def test_delete_branches_non_interactive_batches_local_branches(
+    temp_repo: GitRepo, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that branches without remote tracking are deleted in one call.
+
+    Parameters
+    ----------
+    temp_repo : GitRepo
+        Test repository
+    monkeypatch : pytest.MonkeyPatch
+        Pytest monkeypatch fixture
+    """
+    branch_ops = BranchOperations(temp_repo)
+    names = {"feature/one", "feature/two", "feature/three"}
+    for name in names:
+        temp_repo.create_head(name)
+
+    calls = []
+
+    def counting_delete_branches(repo: GitRepo, branch_names: list[str], force: bool = False) -> None:
+        calls.append(branch_names)
+        delete_branches(repo, branch_names, force)
+
+    monkeypatch.setattr("arborist.git.branch_operations.delete_branches", counting_delete_branches)
+
+    branch_ops._delete_branches_non_interactive(names, force=False, no_verify=False)
+
+    assert calls == [sorted(names)]
+    assert not names & {head.name for head in temp_repo.heads}
+
+
+def test_delete_branches_non_interactive_deletes_remote_branches(
+    temp_repo: GitRepo, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that tracked branches are deleted locally and on the remote.
+
+    Parameters
+    ----------
+    temp_repo : GitRepo
+        Test repository
+    monkeypatch : pytest.MonkeyPatch
+        Pytest monkeypatch fixture
+    """
+    branch_ops = BranchOperations(temp_repo)
+    names = {"feature/one", "feature/two", "feature/stale"}
+    for name in names:
+        temp_repo.create_head(name)
+    temp_repo.git.push("--set-upstream", "origin", *sorted(names))
+
+    pushes = []
+
+    def counting_push(git: Git, *args: str) -> str:
+        pushes.append(args)
+        return git._call_process("push", *args)
+
+    # Git resolves commands dynamically, so the method is added to the class
+    monkeypatch.setattr(Git, "push", counting_push, raising=False)
+
+    # Delete one branch in the remote itself, leaving a stale tracking ref
+    with Repo(temp_repo.remotes.origin.url) as remote:
+        remote.git.branch("-D", "feature/stale")
+
+        with pytest.raises(GitError, match="with remote tracking"):
+            branch_ops._delete_branches_non_interactive(names, force=False, no_verify=True)
+        assert names <= {head.name for head in temp_repo.heads}
+
+        branch_ops._delete_branches_non_interactive(names, force=True, no_verify=True)
+
+        # One push naming every branch, then a retry without the stale one
+        assert pushes == [
+            ("origin", "--delete", "feature/one", "feature/stale", "feature/two"),
+            ("origin", "--delete", "feature/one", "feature/two"),
+        ]
+        assert not names & {head.name for head in temp_repo.heads}
+        assert not names & {head.name for head in remote.heads}
+    assert not {f"origin/{name}" for name in names} & {ref.name for ref in temp_repo.remotes.origin.refs}
+
+
+def test_delete_branches_non_interactive_verifies_before_deleting(temp_repo: GitRepo) -> None:
+    """Test that no branch is deleted if any branch fails verification.
+
+    Parameters
+    ----------
+    temp_repo : GitRepo
+        Test repository
+    """
+    branch_ops = BranchOperations(temp_repo)
+    temp_repo.create_head("feature/merged")
+
+    # Create an unmerged branch
+    unmerged = temp_repo.create_head("feature/unmerged")
+    unmerged.checkout()
+    test_file = Path(temp_repo.working_dir) / "unmerged.txt"
+    test_file.write_text("unmerged content")
+    temp_repo.index.add([str(test_file)])
+    temp_repo.index.commit("Commit on unmerged branch")
+    temp_repo.heads["main"].checkout()
+
+    with pytest.raises(GitError, match="not fully merged"):
+        branch_ops._delete_branches_non_interactive(
+            {"feature/merged", "feature/unmerged"}, force=False, no_verify=False
+        )
+
+    assert "feature/merged" in temp_repo.heads
+    assert "feature/unmerged" in temp_repo.heads
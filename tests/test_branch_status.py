@@ -1,7 +1,8 @@
 """Tests for branch status operations."""
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Generator
+from typing import Any
 
 import pytest
 from git import Repo
@@ -12,44 +13,6 @@ from arborist.git.branch_status import BranchStatusManager
 from arborist.git.common import BranchStatus
 
 
-@pytest.fixture
-def temp_repo(tmp_path: Path) -> Generator[GitRepo, None, None]:
-    """Create a temporary git repository.
-
-    Parameters
-    ----------
-    tmp_path : Path
-        Temporary directory path
-
-    Yields
-    ------
-    GitRepo
-        Temporary git repository
-    """
-    repo_path = tmp_path / "test_repo"
-    repo_path.mkdir()
-    repo = Repo.init(repo_path, initial_branch="main")
-
-    # Create initial commit on main
-    readme_path = repo_path / "README.md"
-    readme_path.write_text("# Test Repository")
-    repo.index.add(["README.md"])
-    repo.index.commit("Initial commit")
-
-    # Create a remote
-    remote_path = tmp_path / "remote"
-    remote_path.mkdir()
-    remote = Repo.init(remote_path, bare=True)
-    repo.create_remote("origin", str(remote_path))
-    repo.git.push("origin", "HEAD:main")
-
-    yield repo
-
-    # Cleanup
-    repo.close()
-    remote.close()
-
-
 @pytest.fixture
 def branch_manager(temp_repo: GitRepo) -> BranchStatusManager:
     """Create a branch status manager.
@@ -133,7 +96,6 @@ def test_get_branch_status_gone(branch_manager: BranchStatusManager, temp_repo:
     """
     # Create a branch and set up tracking
     temp_repo.create_head("feature/test", "HEAD")
-    temp_repo.heads["feature/test"].checkout()
     temp_repo.git.push("--set-upstream", "origin", "feature/test")
 
     # Delete the branch on remote
@@ -144,6 +106,171 @@ def test_get_branch_status_gone(branch_manager: BranchStatusManager, temp_repo:
     assert status["feature/test"] == BranchStatus.GONE
 
 
+def test_get_branch_status_gone_after_remote_deletion(
+    branch_manager: BranchStatusManager, temp_repo: GitRepo, tmp_path: Path
+) -> None:
+    """Test that branches deleted directly on the remote are detected as gone.
+
+    Parameters
+    ----------
+    branch_manager : BranchStatusManager
+        Branch status manager instance
+    temp_repo : GitRepo
+        Temporary git repository
+    tmp_path : Path
+        Temporary directory path
+    """
+    temp_repo.create_head("feature/test", "HEAD")
+    temp_repo.git.push("--set-upstream", "origin", "feature/test")
+
+    # Delete the branch in the remote itself, leaving the local tracking ref stale
+    with Repo(temp_repo.remotes.origin.url) as remote:
+        remote.git.branch("-D", "feature/test")
+
+    # An unreachable remote must not stop the check
+    temp_repo.create_remote("broken", str(tmp_path / "missing"))
+
+    status = branch_manager.get_branch_status()
+    assert status["feature/test"] == BranchStatus.GONE
+    assert status["main"] == BranchStatus.MERGED
+
+
+def test_get_branch_status_skips_remote_without_refspec(
+    branch_manager: BranchStatusManager, temp_repo: GitRepo, tmp_path: Path
+) -> None:
+    """Test that a remote with only a URL configured does not stop the check.
+
+    Parameters
+    ----------
+    branch_manager : BranchStatusManager
+        Branch status manager instance
+    temp_repo : GitRepo
+        Temporary git repository
+    tmp_path : Path
+        Temporary directory path
+    """
+    temp_repo.create_head("feature/test", "HEAD")
+    temp_repo.git.push("--set-upstream", "origin", "feature/test")
+    temp_repo.git.push("origin", "--delete", "feature/test")
+    temp_repo.git.config("remote.up.url", str(tmp_path / "missing"))
+
+    status = branch_manager.get_branch_status()
+    assert status["feature/test"] == BranchStatus.GONE
+    assert status["main"] == BranchStatus.MERGED
+
+
+def test_get_branch_status_sees_later_remote_deletion(branch_manager: BranchStatusManager, temp_repo: GitRepo) -> None:
+    """Test that every status query fetches, so an upstream deleted later is gone.
+
+    Parameters
+    ----------
+    branch_manager : BranchStatusManager
+        Branch status manager instance
+    temp_repo : GitRepo
+        Temporary git repository
+    """
+    temp_repo.create_head("feature/test", "HEAD")
+    temp_repo.git.push("--set-upstream", "origin", "feature/test")
+    assert branch_manager.get_gone_branches() == []
+
+    with Repo(temp_repo.remotes.origin.url) as remote:
+        remote.git.branch("-D", "feature/test")
+
+    assert branch_manager.get_gone_branches() == ["feature/test"]
+
+
+def test_get_branch_status_skips_tags(branch_manager: BranchStatusManager, temp_repo: GitRepo) -> None:
+    """Test that the status fetch updates branches but not tags.
+
+    Parameters
+    ----------
+    branch_manager : BranchStatusManager
+        Branch status manager instance
+    temp_repo : GitRepo
+        Temporary git repository
+    """
+    with Repo(temp_repo.remotes.origin.url) as remote:
+        remote.create_head("feature/remote-only", "main")
+        remote.create_tag("v1.0", "main")
+
+    branch_manager.get_branch_status()
+    assert "origin/feature/remote-only" in [ref.name for ref in temp_repo.remotes.origin.refs]
+    assert "v1.0" not in temp_repo.tags
+
+
+def test_get_branch_status_without_fetch_skips_threads(
+    branch_manager: BranchStatusManager, temp_repo: GitRepo, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that no thread pool is started when there is nothing to fetch.
+
+    Parameters
+    ----------
+    branch_manager : BranchStatusManager
+        Branch status manager instance
+    temp_repo : GitRepo
+        Temporary git repository
+    monkeypatch : pytest.MonkeyPatch
+        Pytest monkeypatch fixture
+    """
+    temp_repo.delete_remote(temp_repo.remotes.origin)
+    temp_repo.create_head("feature/test", "HEAD")
+
+    def fail_executor(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("Thread pool should not be used")
+
+    monkeypatch.setattr("arborist.git.branch_status.ThreadPoolExecutor", fail_executor)
+
+    status = branch_manager.get_branch_status()
+    assert status == {"main": BranchStatus.MERGED, "feature/test": BranchStatus.MERGED}
+
+
+def test_get_branch_status_sequential_matches_concurrent(
+    branch_manager: BranchStatusManager, temp_repo: GitRepo, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that sequential and concurrent status checks agree.
+
+    Only the concurrent check starts a thread pool.
+
+    Parameters
+    ----------
+    branch_manager : BranchStatusManager
+        Branch status manager instance
+    temp_repo : GitRepo
+        Temporary git repository
+    monkeypatch : pytest.MonkeyPatch
+        Pytest monkeypatch fixture
+    """
+    # Create a merged branch, an unmerged branch and a gone branch
+    temp_repo.create_head("feature/merged", "HEAD")
+    temp_repo.create_head("feature/gone", "HEAD")
+    temp_repo.git.push("--set-upstream", "origin", "feature/gone")
+    temp_repo.git.push("origin", "--delete", "feature/gone")
+    unmerged = temp_repo.create_head("feature/unmerged", "HEAD")
+    unmerged.checkout()
+    test_file = Path(temp_repo.working_dir) / "unmerged.txt"
+    test_file.write_text("unmerged")
+    temp_repo.index.add([str(test_file)])
+    temp_repo.index.commit("Unmerged commit")
+    temp_repo.heads.main.checkout()
+
+    pools = []
+
+    def recording_executor(*args: Any, **kwargs: Any) -> ThreadPoolExecutor:
+        pools.append(True)
+        return ThreadPoolExecutor(*args, **kwargs)
+
+    monkeypatch.setattr("arborist.git.branch_status.ThreadPoolExecutor", recording_executor)
+
+    sequential = branch_manager.get_branch_status(concurrent=False)
+    assert pools == []
+    concurrent = branch_manager.get_branch_status(concurrent=True)
+    assert len(pools) == 1
+    assert sequential == concurrent
+    assert sequential["feature/merged"] == BranchStatus.MERGED
+    assert sequential["feature/gone"] == BranchStatus.GONE
+    assert sequential["feature/unmerged"] == BranchStatus.UNMERGED
+
+
 def test_get_branch_status_invalid_target(branch_manager: BranchStatusManager) -> None:
     """Test getting status with invalid target branch.
 
@@ -156,6 +283,23 @@ def test_get_branch_status_invalid_target(branch_manager: BranchStatusManager) -
         branch_manager.get_branch_status("nonexistent")
 
 
+def test_get_branches_with_upstream(branch_manager: BranchStatusManager, temp_repo: GitRepo) -> None:
+    """Test finding branches that have an upstream configured.
+
+    Parameters
+    ----------
+    branch_manager : BranchStatusManager
+        Branch status manager instance
+    temp_repo : GitRepo
+        Temporary git repository
+    """
+    temp_repo.create_head("feature/tracked", "HEAD")
+    temp_repo.create_head("feature/local", "HEAD")
+    temp_repo.git.push("--set-upstream", "origin", "feature/tracked")
+
+    assert branch_manager.get_branches_with_upstream() == {"main", "feature/tracked"}
+
+
 def test_get_gone_branches(branch_manager: BranchStatusManager, temp_repo: GitRepo) -> None:
     """Test getting gone branches.
 
@@ -170,10 +314,7 @@ def test_get_gone_branches(branch_manager: BranchStatusManager, temp_repo: GitRe
     temp_repo.create_head("feature/test1", "HEAD")
     temp_repo.create_head("feature/test2", "HEAD")
 
-    temp_repo.heads["feature/test1"].checkout()
-    temp_repo.git.push("--set-upstream", "origin", "feature/test1")
-    temp_repo.heads["feature/test2"].checkout()
-    temp_repo.git.push("--set-upstream", "origin", "feature/test2")
+    temp_repo.git.push("--set-upstream", "origin", "feature/test1", "feature/test2")
 
     # Delete one branch on remote
     temp_repo.git.push("origin", "--delete", "feature/test1")
@@ -5,10 +5,12 @@ from pathlib import Path
 from typing import Generator
 
 import pytest
+import typer
 from git.repo.base import Repo
 from typer.testing import CliRunner
 
-from arborist.cli import app
+from arborist.cli import _handle_git_error, _parse_protect_option, app
+from arborist.errors import GitError
 
 # Configure logging to show debug messages in test output
 logger = logging.getLogger(__name__)
@@ -30,12 +32,6 @@ logger.addHandler(ch)
 logger.debug("Initializing test module")
 
 
-@pytest.fixture
-def cli_runner() -> CliRunner:
-    """Fixture for CLI runner."""
-    return CliRunner(env={"NO_COLOR": "1"})
-
-
 @pytest.fixture
 def cli_app() -> Generator:
     """Fixture for CLI app."""
@@ -94,5 +90,27 @@ def test_list_command(cli_runner: CliRunner, cli_app, temp_repo: Repo) -> None:
     assert "feature/test" in result.output
 
 
+@pytest.mark.parametrize(
+    "protect, expected",
+    [
+        ("main", ["main"]),
+        ("main,develop", ["main", "develop"]),
+        (" main , release/* ", ["main", "release/*"]),
+    ],
+)
+def test_parse_protect_option(protect: str, expected: list[str]) -> None:
+    """Test parsing of the --protect option."""
+    assert _parse_protect_option(protect) == expected
+
+
+def test_handle_git_error(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test that git errors are printed and turned into an exit code."""
+    with pytest.raises(typer.Exit) as exc_info:
+        _handle_git_error(GitError("Something went wrong"), exit_code=2)
+
+    assert exc_info.value.exit_code == 2
+    assert "Error: Something went wrong" in capsys.readouterr().out
+
+
 if __name__ == "__main__":
     pytest.main(["-v", __file__])
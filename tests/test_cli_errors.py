@@ -34,12 +34,10 @@ from arborist.cli import app
 #     assert result.exit_code == 1
 
 
-def test_list_command_invalid_repo():
+def test_list_command_invalid_repo(cli_runner: CliRunner) -> None:
     """Test list command with invalid repository path."""
-    runner = CliRunner()
-
     # Try to list branches in a non-existent repository
-    result = runner.invoke(app, ["list", "--path", "/nonexistent/path"])
+    result = cli_runner.invoke(app, ["list", "--path", "/nonexistent/path"])
     assert "not a git repository" in result.stdout.lower()
     assert result.exit_code == 1
 
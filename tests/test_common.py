@@ -3,14 +3,17 @@
 from pathlib import Path
 
 import pytest
-from git import GitCommandError, Repo
+from git import GitCommandError
 from git.repo.base import Repo as GitRepo
 
 from arborist.errors import GitError
 from arborist.git.common import (
+    compile_protect_patterns,
+    delete_branches,
     get_branch,
     get_current_branch_name,
     get_latest_commit_sha,
+    get_worktree_branches,
     is_branch_upstream_of_another,
     log_git_error,
     validate_branch_doesnt_exist,
@@ -19,58 +22,48 @@ from arborist.git.common import (
 )
 
 
-@pytest.fixture
-def temp_repo(tmp_path: Path) -> GitRepo:
-    """Create a temporary git repository.
+@pytest.mark.parametrize("branch_name", ["feature/test", "release-1.0", "hotfix_123", "main"])
+def test_validate_branch_name(branch_name: str) -> None:
+    """Test that valid branch names pass validation.
 
     Parameters
     ----------
-    tmp_path : Path
-        Temporary directory path
-
-    Returns
-    -------
-    GitRepo
-        Temporary git repository
+    branch_name : str
+        Branch name to validate
     """
-    repo_path = tmp_path / "test_repo"
-    repo_path.mkdir()
-    repo = Repo.init(repo_path, initial_branch="main")
-
-    # Create initial commit
-    readme_path = repo_path / "README.md"
-    readme_path.write_text("# Test Repository")
-    repo.index.add(["README.md"])
-    repo.index.commit("Initial commit")
-
-    return repo
-
-
-def test_validate_branch_name() -> None:
-    """Test branch name validation."""
-    # Valid branch names
-    validate_branch_name("feature/test")
-    validate_branch_name("release-1.0")
-    validate_branch_name("hotfix_123")
-    validate_branch_name("main")
-
-    # Invalid branch names
-    with pytest.raises(GitError, match="Branch name cannot be empty"):
-        validate_branch_name("")
-
-    with pytest.raises(GitError, match="contains invalid characters"):
-        validate_branch_name("feature~test")
-        validate_branch_name("feature test")
-        validate_branch_name("feature*test")
-        validate_branch_name("feature?test")
-        validate_branch_name("feature[test]")
-        validate_branch_name("feature\\test")
+    validate_branch_name(branch_name)
+
+
+@pytest.mark.parametrize(
+    "branch_name, message",
+    [
+        ("", "Branch name cannot be empty"),
+        ("feature~test", "contains invalid characters"),
+        ("feature test", "contains invalid characters"),
+        ("feature*test", "contains invalid characters"),
+        ("feature?test", "contains invalid characters"),
+        ("feature[test]", "contains invalid characters"),
+        ("feature\\test", "contains invalid characters"),
+        ("feature\ttest", "contains control characters"),
+        ("feature\x7ftest", "contains control characters"),
+        ("-feature", "is invalid"),
+        ("feature-", "is invalid"),
+        ("/feature", "is invalid"),
+        ("feature/", "is invalid"),
+    ],
+)
+def test_validate_branch_name_invalid(branch_name: str, message: str) -> None:
+    """Test that invalid branch names are rejected.
 
-    with pytest.raises(GitError, match="is invalid"):
-        validate_branch_name("-feature")
-        validate_branch_name("feature-")
-        validate_branch_name("/feature")
-        validate_branch_name("feature/")
+    Parameters
+    ----------
+    branch_name : str
+        Branch name to validate
+    message : str
+        Expected fragment of the error message
+    """
+    with pytest.raises(GitError, match=message):
+        validate_branch_name(branch_name)
 
 
 def test_validate_branch_exists(temp_repo: GitRepo) -> None:
@@ -122,6 +115,46 @@ def test_get_branch(temp_repo: GitRepo) -> None:
         get_branch(temp_repo, "nonexistent")
 
 
+def test_delete_branches(temp_repo: GitRepo) -> None:
+    """Test deleting several branches with one call.
+
+    Parameters
+    ----------
+    temp_repo : GitRepo
+        Temporary git repository
+    """
+    temp_repo.create_head("feature/one")
+    temp_repo.create_head("feature/two")
+
+    delete_branches(temp_repo, ["feature/one", "feature/two"])
+    assert "feature/one" not in temp_repo.heads
+    assert "feature/two" not in temp_repo.heads
+
+    # Names after "--" are never read as options
+    with pytest.raises(GitCommandError, match="not found"):
+        delete_branches(temp_repo, ["--all"])
+
+
+def test_get_worktree_branches(temp_repo: GitRepo, tmp_path: Path) -> None:
+    """Test mapping branches to the worktrees they are checked out in.
+
+    Parameters
+    ----------
+    temp_repo : GitRepo
+        Temporary git repository
+    tmp_path : Path
+        Temporary directory path
+    """
+    worktree = tmp_path / "worktree"
+    temp_repo.git.worktree("add", "-b", "feature/worktree", str(worktree))
+    temp_repo.git.worktree("add", "--detach", str(tmp_path / "detached"))
+
+    assert get_worktree_branches(temp_repo) == {
+        "main": temp_repo.working_tree_dir,
+        "feature/worktree": str(worktree),
+    }
+
+
 def test_get_current_branch_name(temp_repo: GitRepo) -> None:
     """Test getting current branch name.
 
@@ -208,3 +241,35 @@ def test_log_git_error(caplog: pytest.LogCaptureFixture) -> None:
     error = GitCommandError("git", 1)
     log_git_error(error, "Test message")
     assert "Test message" in caplog.text
+
+
+@pytest.mark.parametrize(
+    ("branch_name", "protected"),
+    [
+        ("main", True),
+        ("main-1.0", True),
+        ("main/hotfix", True),
+        ("mainline", False),
+        ("release/1.0", True),
+        ("release", False),
+        ("develop", True),
+        ("feature/test", False),
+    ],
+)
+def test_compile_protect_patterns(branch_name: str, protected: bool) -> None:
+    """Test exact, prefix and wildcard protection matching.
+
+    Parameters
+    ----------
+    branch_name : str
+        Branch name to check
+    protected : bool
+        Whether the branch should be protected
+    """
+    pattern = compile_protect_patterns(["main", "release/*", "dev*"])
+    assert bool(pattern.match(branch_name)) is protected
+
+
+def test_compile_protect_patterns_empty() -> None:
+    """Test that no patterns protect no branches."""
+    assert compile_protect_patterns([]).match("main") is None
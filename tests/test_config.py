@@ -1,6 +1,5 @@
 """Tests for configuration handling."""
 
-import os
 from pathlib import Path
 from typing import Generator
 
@@ -41,24 +40,43 @@ def test_default_config() -> None:
     assert config.log_level == "INFO"
 
 
-def test_config_from_env() -> None:
-    """Test configuration from environment variables."""
-    os.environ["ARBORIST_BRANCH__PROTECTED_PATTERNS"] = '["develop", "staging"]'
-    os.environ["ARBORIST_GIT__REFLOG_EXPIRY"] = "30.days"
-    os.environ["ARBORIST_DRY_RUN_BY_DEFAULT"] = "true"
-    os.environ["ARBORIST_LOG_LEVEL"] = "DEBUG"
+@pytest.mark.parametrize(
+    ("env_var", "value", "section", "field", "expected"),
+    [
+        ("ARBORIST_BRANCH__PROTECTED_PATTERNS", '["develop", "qa"]', "branch", "protected_patterns", ["develop", "qa"]),
+        ("ARBORIST_BRANCH__NAME_PATTERN", r"^feature/[a-z0-9-]+$", "branch", "name_pattern", r"^feature/[a-z0-9-]+$"),
+        ("ARBORIST_BRANCH__INVALID_CHARS", '["#", "@"]', "branch", "invalid_chars", ["#", "@"]),
+        ("ARBORIST_GIT__REFLOG_EXPIRY", "30.days", "git", "reflog_expiry", "30.days"),
+        ("ARBORIST_GIT__GC_AUTO", "false", "git", "gc_auto", False),
+        ("ARBORIST_DRY_RUN_BY_DEFAULT", "true", None, "dry_run_by_default", True),
+        ("ARBORIST_LOG_LEVEL", "DEBUG", None, "log_level", "DEBUG"),
+    ],
+)
+def test_config_from_env(
+    monkeypatch: pytest.MonkeyPatch, env_var: str, value: str, section: str | None, field: str, expected: object
+) -> None:
+    """Test configuration from environment variables.
 
-    config = ArboristConfig()
-    assert config.branch.protected_patterns == ["develop", "staging"]
-    assert config.git.reflog_expiry == "30.days"
-    assert config.dry_run_by_default
-    assert config.log_level == "DEBUG"
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        Pytest monkeypatch fixture
+    env_var : str
+        Environment variable to set
+    value : str
+        Value of the environment variable
+    section : str | None
+        Nested configuration section, or None for top-level settings
+    field : str
+        Configuration field set by the environment variable
+    expected : object
+        Expected field value
+    """
+    monkeypatch.setenv(env_var, value)
 
-    # Clean up
-    del os.environ["ARBORIST_BRANCH__PROTECTED_PATTERNS"]
-    del os.environ["ARBORIST_GIT__REFLOG_EXPIRY"]
-    del os.environ["ARBORIST_DRY_RUN_BY_DEFAULT"]
-    del os.environ["ARBORIST_LOG_LEVEL"]
+    config = ArboristConfig()
+    target = getattr(config, section) if section else config
+    assert getattr(target, field) == expected
 
 
 def test_invalid_log_level() -> None:
@@ -163,30 +181,15 @@ def test_invalid_chars_config() -> None:
     assert config.branch.invalid_chars == []
 
 
-def test_nested_env_config() -> None:
-    """Test nested environment variable configuration."""
-    os.environ["ARBORIST_BRANCH__NAME_PATTERN"] = r"^feature/[a-z0-9-]+$"
-    os.environ["ARBORIST_BRANCH__INVALID_CHARS"] = '["#", "@"]'
-    os.environ["ARBORIST_GIT__GC_AUTO"] = "false"
-
-    config = ArboristConfig()
-    assert config.branch.name_pattern == r"^feature/[a-z0-9-]+$"
-    assert config.branch.invalid_chars == ["#", "@"]
-    assert not config.git.gc_auto
-
-    # Clean up
-    del os.environ["ARBORIST_BRANCH__NAME_PATTERN"]
-    del os.environ["ARBORIST_BRANCH__INVALID_CHARS"]
-    del os.environ["ARBORIST_GIT__GC_AUTO"]
-
-
-def test_config_precedence(temp_config_file: Path) -> None:
+def test_config_precedence(temp_config_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     """Test configuration precedence (env vars override file).
 
     Parameters
     ----------
     temp_config_file : Path
         Path to temporary config file
+    monkeypatch : pytest.MonkeyPatch
+        Pytest monkeypatch fixture
     """
     # Create config file
     config = ArboristConfig(
@@ -196,14 +199,28 @@ def test_config_precedence(temp_config_file: Path) -> None:
     config.save_config(temp_config_file)
 
     # Set environment variables
-    os.environ["ARBORIST_BRANCH__PROTECTED_PATTERNS"] = '["main", "master"]'
-    os.environ["ARBORIST_GIT__REFLOG_EXPIRY"] = "30.days"
+    monkeypatch.setenv("ARBORIST_BRANCH__PROTECTED_PATTERNS", '["main", "master"]')
+    monkeypatch.setenv("ARBORIST_GIT__REFLOG_EXPIRY", "30.days")
 
     # Load config - env vars should take precedence
     loaded_config = ArboristConfig.load_config(str(temp_config_file))
     assert loaded_config.branch.protected_patterns == ["main", "master"]
     assert loaded_config.git.reflog_expiry == "30.days"
 
-    # Clean up
-    del os.environ["ARBORIST_BRANCH__PROTECTED_PATTERNS"]
-    del os.environ["ARBORIST_GIT__REFLOG_EXPIRY"]
+
+def test_env_set_between_loads_overrides_file(temp_config_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that an environment variable set after an earlier load still wins.
+
+    Parameters
+    ----------
+    temp_config_file : Path
+        Path to temporary config file
+    monkeypatch : pytest.MonkeyPatch
+        Pytest monkeypatch fixture
+    """
+    ArboristConfig(log_level="WARNING").save_config(temp_config_file)
+    assert ArboristConfig.load_config(str(temp_config_file)).log_level == "WARNING"
+
+    monkeypatch.setenv("ARBORIST_LOG_LEVEL", "DEBUG")
+
+    assert ArboristConfig.load_config(str(temp_config_file)).log_level == "DEBUG"
@@ -1,22 +1,25 @@
 """Integration tests for arborist CLI."""
 
 import logging
-import os
-import subprocess
 from pathlib import Path
-from typing import Generator, TypedDict
+from typing import Callable, Generator, TypedDict
 
 import pytest
 from git import GitCommandError, Repo
 from git.repo.base import Repo as GitRepo
+from typer.testing import CliRunner
+
+from arborist.cli import app
 
 logger = logging.getLogger(__name__)
 
+pytestmark = pytest.mark.slow
+
 
 class BranchScenario(TypedDict):
     """Branch scenario configuration."""
 
-    files: list[tuple[str, str]] | tuple[str, str]
+    files: list[tuple[str, str]]
     should_merge: bool
     has_remote: bool
 
@@ -32,25 +35,25 @@ def _get_test_scenarios() -> dict[str, BranchScenario]:
     return {
         # Regular merged branch
         "feature/merged": {
-            "files": ("merged.txt", "Merged feature"),
+            "files": [("merged.txt", "Merged feature")],
             "should_merge": True,  # Should be merged
             "has_remote": False,  # No remote
         },
         # Unmerged branch
         "feature/unmerged": {
-            "files": ("unmerged.txt", "Unmerged feature"),
+            "files": [("unmerged.txt", "Unmerged feature")],
             "should_merge": False,  # Should not be merged
             "has_remote": False,  # No remote
         },
         # Branch with remote tracking
         "feature/remote": {
-            "files": ("remote.txt", "Remote feature"),
+            "files": [("remote.txt", "Remote feature")],
             "should_merge": True,  # Should be merged
             "has_remote": True,  # Has remote
         },
         # Protected branch pattern
         "release/1.0": {
-            "files": ("release.txt", "Release 1.0"),
+            "files": [("release.txt", "Release 1.0")],
             "should_merge": True,  # Should be merged
             "has_remote": False,  # No remote
         },
@@ -66,19 +69,19 @@ def _get_test_scenarios() -> dict[str, BranchScenario]:
         },
         # Branch with merge conflicts
         "feature/conflicts": {
-            "files": ("conflict.txt", "This will conflict"),
+            "files": [("conflict.txt", "This will conflict")],
             "should_merge": False,  # Should not be merged
             "has_remote": False,  # No remote
         },
         # Branch with remote but deleted upstream
         "feature/gone": {
-            "files": ("gone.txt", "Gone feature"),
+            "files": [("gone.txt", "Gone feature")],
             "should_merge": False,  # Should not be merged
             "has_remote": True,  # Has remote (initially)
         },
         # Branch with special characters
         "feature/special-chars-#123": {
-            "files": ("special.txt", "Special chars"),
+            "files": [("special.txt", "Special chars")],
             "should_merge": True,  # Should be merged
             "has_remote": False,  # No remote
         },
@@ -97,47 +100,32 @@ def _setup_test_branches(repo: GitRepo, repo_path: Path, scenarios: dict[str, Br
     scenarios : dict[str, BranchScenario]
         Branch scenarios to set up
     """
-    # Create each branch first
-    for branch_name in scenarios:
-        repo.create_head(branch_name)
-
-    # Create merge conflict scenario first
-    repo.heads["feature/conflicts"].checkout()
-    conflict_file = repo_path / "conflict.txt"
-    conflict_file.write_text("Conflict branch content")
-    repo.index.add([str(conflict_file)])
-    repo.index.commit("Add conflict file on feature branch")
-
-    repo.heads.main.checkout()
-    conflict_file.write_text("Main branch content")
-    repo.index.add([str(conflict_file)])
+    # Build every branch in a single pass, each starting from the initial
+    # main. The conflict branch is built last and main then diverges on the
+    # same file, leaving main checked out
+    main = repo.heads.main
+    for branch_name in sorted(scenarios, key=lambda name: name == "feature/conflicts"):
+        repo.create_head(branch_name, main.commit).checkout()
+
+        # Commits are built from the in-memory index, so the index file is
+        # written once after the branch's last commit instead of per file
+        index = repo.index
+        for filename, content in scenarios[branch_name]["files"]:
+            (repo_path / filename).write_text(content)
+            index.add([filename], write=False)
+            index.commit(f"Add {filename}")
+        index.write()
+
+    main.checkout()
+    conflict_rel = "conflict.txt"
+    (repo_path / conflict_rel).write_text("Main branch content")
+    repo.index.add([conflict_rel])
     repo.index.commit("Add conflict file on main")
 
-    # Now create content for other branches
-    for branch_name, scenario in scenarios.items():
-        if branch_name == "feature/conflicts":
-            continue  # Skip, already handled
-
-        branch = repo.heads[branch_name]
-        branch.checkout()
-
-        # Handle multi-commit scenarios
-        files = scenario["files"]
-        if isinstance(files, list):
-            for filename, content in files:
-                test_file = repo_path / filename
-                test_file.write_text(content)
-                repo.index.add([str(test_file)])
-                repo.index.commit(f"Add {filename}")
-        else:
-            filename, content = files
-            test_file = repo_path / filename
-            test_file.write_text(content)
-            repo.index.add([str(test_file)])
-            repo.index.commit(f"Add {filename}")
-
-        if scenario["has_remote"]:
-            repo.git.push("--set-upstream", "origin", branch_name)
+    # Publish every branch that needs a remote with a single push
+    remote_branches = [name for name, scenario in scenarios.items() if scenario["has_remote"]]
+    if remote_branches:
+        repo.git.push("--atomic", "--set-upstream", "origin", *remote_branches)
 
 
 def _merge_test_branches(repo: GitRepo, scenarios: dict[str, BranchScenario]) -> None:
@@ -151,11 +139,16 @@ def _merge_test_branches(repo: GitRepo, scenarios: dict[str, BranchScenario]) ->
         Branch scenarios to merge
     """
     # Ensure we're on main and it's up to date
-    if "main" not in repo.heads:
+    heads_by_name = {head.name: head for head in repo.heads}
+    if "main" not in heads_by_name:
         raise ValueError("Main branch not found. Repository not properly initialized.")
+    main = heads_by_name["main"]
 
-    repo.heads.main.checkout()
-    if repo.heads.main.tracking_branch():
+    # Pulling only makes sense with a remote; skip the tracking probes otherwise
+    has_any_remote = bool(repo.remotes)
+
+    main.checkout()
+    if has_any_remote and main.tracking_branch():
         repo.git.pull("--ff-only")  # Update main if it has a tracking branch
 
     # Try to merge branches that should be merged
@@ -163,16 +156,16 @@ def _merge_test_branches(repo: GitRepo, scenarios: dict[str, BranchScenario]) ->
         if scenario["should_merge"]:
             try:
                 # First update the branch to ensure it's up to date
-                repo.heads[branch_name].checkout()
-                if repo.heads[branch_name].tracking_branch():
+                heads_by_name[branch_name].checkout()
+                if has_any_remote and scenario["has_remote"]:
                     repo.git.pull("--ff-only")
 
                 # Then merge into main
-                repo.heads.main.checkout()
-                repo.git.merge(branch_name, no_ff=True)  # Force a merge commit
+                main.checkout()
+                repo.git.merge(branch_name)
 
                 # Verify the merge was successful
-                if repo.is_ancestor(repo.heads[branch_name].commit, repo.heads.main.commit):
+                if repo.is_ancestor(heads_by_name[branch_name].commit, main.commit):
                     logger.debug("Successfully merged %s into main", branch_name)
                 else:
                     logger.warning("Failed to merge %s into main", branch_name)
@@ -180,55 +173,141 @@ def _merge_test_branches(repo: GitRepo, scenarios: dict[str, BranchScenario]) ->
             except GitCommandError as err:
                 logger.error("Error merging %s: %s", branch_name, err)
                 repo.git.merge("--abort")
-                repo.heads.main.checkout()
+                main.checkout()
+
+    main.checkout()
+
+
+@pytest.fixture(scope="module")
+def scenario_repo_dir(
+    template_repo_dir: Path, copy_repo: Callable[[Path, Path], Repo], tmp_path_factory: pytest.TempPathFactory
+) -> Path:
+    """Build the repository with the branch scenarios once per module.
+
+    Parameters
+    ----------
+    template_repo_dir : Path
+        Template repository directory from conftest.py
+    copy_repo : Callable[[Path, Path], Repo]
+        Helper copying a repository and its remote
+    tmp_path_factory : pytest.TempPathFactory
+        Session-scoped temporary directory factory
+
+    Returns
+    -------
+    Path
+        Directory containing the scenario ``test_repo`` and its ``remote``
+    """
+    scenario_dir = tmp_path_factory.mktemp("scenario")
+    repo = copy_repo(template_repo_dir, scenario_dir)
+    repo_path = Path(repo.working_dir)
+
+    # Get and set up test scenarios
+    scenarios = _get_test_scenarios()
+    _setup_test_branches(repo, repo_path, scenarios)
+    _merge_test_branches(repo, scenarios)
+
+    # Publish main and simulate the deleted upstream of feature/gone with a
+    # single push. Deleting via push also drops the local remote-tracking
+    # ref, so no fetch is needed
+    repo.git.push("origin", "main", ":feature/gone")
+    repo.close()
 
-    # Ensure we push all changes to main
-    repo.heads.main.checkout()
-    if repo.heads.main.tracking_branch():
-        repo.git.push("origin", "main")
+    return scenario_dir
 
 
 @pytest.fixture
-def test_repo(temp_repo: Repo) -> Generator[GitRepo, None, None]:
+def test_repo(
+    scenario_repo_dir: Path,
+    copy_repo: Callable[[Path, Path], Repo],
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> Generator[GitRepo, None, None]:
     """Create a test repository with various branch scenarios.
 
+    Each test gets its own copy of the scenario repository and remote, so
+    tests that delete branches cannot affect each other.
+
     Parameters
     ----------
-    temp_repo : Repo
-        Base test repository from conftest.py
+    scenario_repo_dir : Path
+        Scenario repository directory built once per module
+    copy_repo : Callable[[Path, Path], Repo]
+        Helper copying a repository and its remote
+    tmp_path : Path
+        Temporary directory path
+    monkeypatch : pytest.MonkeyPatch
+        Pytest monkeypatch fixture
 
     Yields
     ------
     GitRepo
         Test repository with scenarios
     """
-    repo = temp_repo
-    repo_path = Path(repo.working_dir)
+    repo = copy_repo(scenario_repo_dir, tmp_path)
 
-    # Get and set up test scenarios
-    scenarios = _get_test_scenarios()
-    _setup_test_branches(repo, repo_path, scenarios)
-    _merge_test_branches(repo, scenarios)
+    # Change working directory to repo; monkeypatch restores it
+    monkeypatch.chdir(repo.working_dir)
+
+    yield repo
+
+    repo.close()
+
+
+@pytest.fixture
+def readonly_repo(scenario_repo_dir: Path, monkeypatch: pytest.MonkeyPatch) -> Generator[GitRepo, None, None]:
+    """Open the shared scenario repository for tests that do not modify it.
+
+    Skips the per-test copy made by ``test_repo``. Only for commands that
+    cannot delete branches, such as ``arb list`` and ``arb clean --dry-run``;
+    a test running a real clean here could break every later test in the
+    module.
+
+    Parameters
+    ----------
+    scenario_repo_dir : Path
+        Scenario repository directory built once per module
+    monkeypatch : pytest.MonkeyPatch
+        Pytest monkeypatch fixture
 
-    # Simulate deleted upstream branch for feature/gone
-    repo.git.push("origin", ":feature/gone")  # Delete remote branch
-    repo.git.fetch("--prune")  # Update remote tracking info
+    Yields
+    ------
+    GitRepo
+        Shared scenario repository
+    """
+    repo = Repo(scenario_repo_dir / "test_repo")
 
-    # Change working directory to repo
-    old_cwd = os.getcwd()
-    os.chdir(repo_path)
+    # Change working directory to repo; monkeypatch restores it
+    monkeypatch.chdir(repo.working_dir)
 
     yield repo
 
-    # Restore working directory
-    os.chdir(old_cwd)
+    repo.close()
+
+
+def head_names(repo: GitRepo) -> frozenset[str]:
+    """Get the names of all local branches.
+
+    Parameters
+    ----------
+    repo : GitRepo
+        Repository to list branches of
+
+    Returns
+    -------
+    frozenset[str]
+        Local branch names
+    """
+    return frozenset(head.name for head in repo.heads)
 
 
-def run_arb(args: list[str], input_text: str | None = None) -> tuple[int, str, str]:
-    """Run arb command and return its output.
+def run_arb(runner: CliRunner, args: list[str], input_text: str | None = None) -> tuple[int, str, str]:
+    """Run arb command in-process and return its output.
 
     Parameters
     ----------
+    runner : CliRunner
+        Shared CLI runner from conftest.py
     args : List[str]
         Command arguments
     input_text : Optional[str]
@@ -239,245 +318,245 @@ def run_arb(args: list[str], input_text: str | None = None) -> tuple[int, str, s
     Tuple[int, str, str]
         Exit code, stdout, and stderr
     """
-    process = subprocess.run(
-        ["arb"] + args,
-        input=input_text,
-        capture_output=True,
-        text=True,
-    )
-    return process.returncode, process.stdout, process.stderr
+    result = runner.invoke(app, args, input=input_text, catch_exceptions=False)
+    return result.exit_code, result.stdout, result.stderr
 
 
-def test_list_command(test_repo: GitRepo) -> None:
-    """Test arb list command.
+@pytest.fixture(scope="module")
+def list_result(
+    scenario_repo_dir: Path,
+    copy_repo: Callable[[Path, Path], Repo],
+    tmp_path_factory: pytest.TempPathFactory,
+    cli_runner: CliRunner,
+) -> tuple[int, str, str]:
+    """Run ``arb list`` on a copy of the scenario repository once per module.
+
+    Listing deletes no branches, so every test checking the initial branch
+    states can share this result. It does fetch and prune, which writes
+    remote-tracking refs, so it runs on its own copy rather than on the
+    scenario every ``test_repo`` is copied from.
 
     Parameters
     ----------
-    test_repo : GitRepo
-        Test repository
+    scenario_repo_dir : Path
+        Scenario repository directory built once per module
+    copy_repo : Callable[[Path, Path], Repo]
+        Helper copying a repository and its remote
+    tmp_path_factory : pytest.TempPathFactory
+        Session-scoped temporary directory factory
+    cli_runner : CliRunner
+        Shared CLI runner from conftest.py
+
+    Returns
+    -------
+    tuple[int, str, str]
+        Exit code, stdout, and stderr
     """
-    exit_code, stdout, stderr = run_arb(["list"])
-    assert exit_code == 0
-    assert "feature/merged" in stdout
-    assert "feature/unmerged" in stdout
-    assert "feature/remote" in stdout
-    assert "release/1.0" in stdout
-    assert "merged" in stdout.lower()
-    assert "unmerged" in stdout.lower()
+    repo = copy_repo(scenario_repo_dir, tmp_path_factory.mktemp("list"))
+    try:
+        return run_arb(cli_runner, ["list", "--path", str(repo.working_dir)])
+    finally:
+        repo.close()
 
 
-def test_clean_merged_branch(test_repo: GitRepo) -> None:
-    """Test cleaning a merged branch without remote tracking.
+def test_list_command(list_result: tuple[int, str, str]) -> None:
+    """Test arb list command.
 
     Parameters
     ----------
-    test_repo : GitRepo
-        Test repository
+    list_result : tuple[int, str, str]
+        Result of ``arb list`` on the scenario repository
     """
-    # Clean with auto-yes
-    exit_code, stdout, stderr = run_arb(["clean", "--no-interactive"])
+    exit_code, stdout, stderr = list_result
     assert exit_code == 0
     assert "feature/merged" in stdout
-    assert "Successfully deleted" in stdout
+    assert "feature/unmerged" in stdout
+    assert "feature/remote" in stdout
+    assert "release/1.0" in stdout
+    assert "merged" in stdout.lower()
+    assert "unmerged" in stdout.lower()
 
-    # Verify branch is gone
-    assert "feature/merged" not in [b.name for b in test_repo.heads]
 
+@pytest.mark.parametrize("branch", ["feature/merged", "feature/multi-commit", "feature/special-chars-#123"])
+def test_clean_merged_branches(test_repo: GitRepo, branch: str, cli_runner: CliRunner) -> None:
+    """Test cleaning merged branches without remote tracking.
 
-def test_clean_with_force(test_repo: GitRepo) -> None:
-    """Test force cleaning branches.
+    Covers a plain merged branch, one with multiple commits and one with
+    special characters in its name.
 
     Parameters
     ----------
     test_repo : GitRepo
         Test repository
+    branch : str
+        Merged branch expected to be deleted
+    cli_runner : CliRunner
+        Shared CLI runner from conftest.py
     """
-    # Clean with force and auto-yes
-    exit_code, stdout, stderr = run_arb(["clean", "--force", "--no-interactive"])
+    # Clean with auto-yes
+    exit_code, stdout, stderr = run_arb(cli_runner, ["clean", "--no-interactive"])
     assert exit_code == 0
-    assert "feature/unmerged" in stdout
+    assert branch in stdout
     assert "Successfully deleted" in stdout
 
     # Verify branch is gone
-    assert "feature/unmerged" not in [b.name for b in test_repo.heads]
+    assert branch not in head_names(test_repo)
 
 
-def test_clean_with_protection(test_repo: GitRepo) -> None:
-    """Test branch protection during cleanup.
+@pytest.mark.parametrize("branch", ["feature/remote", "feature/conflicts"])
+def test_clean_requires_force(test_repo: GitRepo, branch: str, cli_runner: CliRunner) -> None:
+    """Test that remote tracking and conflicting branches need force.
 
     Parameters
     ----------
     test_repo : GitRepo
         Test repository
+    branch : str
+        Branch that is only deleted with force
+    cli_runner : CliRunner
+        Shared CLI runner from conftest.py
     """
-    # Clean with protection and auto-yes
-    exit_code, stdout, stderr = run_arb(["clean", "--protect", "release/*", "--no-interactive"])
+    # Try to clean without force
+    exit_code, stdout, stderr = run_arb(cli_runner, ["clean", "--no-interactive"])
     assert exit_code == 0
-    assert "release/1.0" not in stdout
-
-    # Verify protected branch still exists
-    assert "release/1.0" in [b.name for b in test_repo.heads]
-
-
-def test_clean_dry_run(test_repo: GitRepo) -> None:
-    """Test dry run mode.
+    assert branch not in stdout  # Should not be suggested for deletion
 
-    Parameters
-    ----------
-    test_repo : GitRepo
-        Test repository
-    """
-    # Clean with dry-run
-    exit_code, stdout, stderr = run_arb(["clean", "--dry-run"])
+    # Clean with force
+    exit_code, stdout, stderr = run_arb(cli_runner, ["clean", "--force", "--no-interactive"])
     assert exit_code == 0
-    assert "Dry run" in stdout
-    assert "feature/merged" in stdout
+    assert branch in stdout
+    assert "Successfully deleted" in stdout
 
-    # Verify no branches were actually deleted
-    assert "feature/merged" in [b.name for b in test_repo.heads]
+    # Verify branch is gone
+    assert branch not in head_names(test_repo)
 
 
-def test_clean_remote_tracking_branch(test_repo: GitRepo) -> None:
-    """Test cleaning a branch with remote tracking.
+def test_clean_with_force(test_repo: GitRepo, cli_runner: CliRunner) -> None:
+    """Test force cleaning branches.
 
     Parameters
     ----------
     test_repo : GitRepo
         Test repository
+    cli_runner : CliRunner
+        Shared CLI runner from conftest.py
     """
-    # Try to clean without force
-    exit_code, stdout, stderr = run_arb(["clean", "--no-interactive"])
-    assert exit_code == 0
-    assert "feature/remote" not in stdout
-
-    # Clean with force
-    exit_code, stdout, stderr = run_arb(["clean", "--force", "--no-interactive"])
+    # Clean with force and auto-yes
+    exit_code, stdout, stderr = run_arb(cli_runner, ["clean", "--force", "--no-interactive"])
     assert exit_code == 0
-    assert "feature/remote" in stdout
+    assert "feature/unmerged" in stdout
     assert "Successfully deleted" in stdout
 
     # Verify branch is gone
-    assert "feature/remote" not in [b.name for b in test_repo.heads]
+    assert "feature/unmerged" not in head_names(test_repo)
 
 
-def test_clean_multi_commit_branch(test_repo: GitRepo) -> None:
-    """Test cleaning a branch with multiple commits.
+def test_clean_with_protection(test_repo: GitRepo, cli_runner: CliRunner) -> None:
+    """Test branch protection during cleanup.
 
     Parameters
     ----------
     test_repo : GitRepo
         Test repository
+    cli_runner : CliRunner
+        Shared CLI runner from conftest.py
     """
-    # Clean with auto-yes
-    exit_code, stdout, stderr = run_arb(["clean", "--no-interactive"])
+    # Clean with protection and auto-yes
+    exit_code, stdout, stderr = run_arb(cli_runner, ["clean", "--protect", "release/*", "--no-interactive"])
     assert exit_code == 0
-    assert "feature/multi-commit" in stdout
-    assert "Successfully deleted" in stdout
+    assert "release/1.0" not in stdout
 
-    # Verify branch is gone
-    assert "feature/multi-commit" not in [b.name for b in test_repo.heads]
+    # Verify protected branch still exists
+    assert "release/1.0" in head_names(test_repo)
 
 
-def test_clean_branch_with_conflicts(test_repo: GitRepo) -> None:
-    """Test cleaning a branch that has merge conflicts.
+def test_clean_dry_run(readonly_repo: GitRepo, cli_runner: CliRunner) -> None:
+    """Test dry run mode.
 
     Parameters
     ----------
-    test_repo : GitRepo
-        Test repository
+    readonly_repo : GitRepo
+        Shared scenario repository
+    cli_runner : CliRunner
+        Shared CLI runner from conftest.py
     """
-    # Try to clean without force
-    exit_code, stdout, stderr = run_arb(["clean", "--no-interactive"])
-    assert exit_code == 0
-    assert "feature/conflicts" not in stdout  # Should not be suggested for deletion
-
-    # Clean with force
-    exit_code, stdout, stderr = run_arb(["clean", "--force", "--no-interactive"])
+    # Clean with dry-run
+    exit_code, stdout, stderr = run_arb(cli_runner, ["clean", "--dry-run"])
     assert exit_code == 0
-    assert "feature/conflicts" in stdout
-    assert "Successfully deleted" in stdout
+    assert "Dry run" in stdout
+    assert "feature/merged" in stdout
 
-    # Verify branch is gone
-    assert "feature/conflicts" not in [b.name for b in test_repo.heads]
+    # Verify no branches were actually deleted
+    assert "feature/merged" in head_names(readonly_repo)
 
 
-def test_clean_gone_branch(test_repo: GitRepo) -> None:
+def test_clean_gone_branch(test_repo: GitRepo, list_result: tuple[int, str, str], cli_runner: CliRunner) -> None:
     """Test cleaning a branch whose remote was deleted.
 
     Parameters
     ----------
     test_repo : GitRepo
         Test repository
+    list_result : tuple[int, str, str]
+        Result of ``arb list`` on the scenario repository
+    cli_runner : CliRunner
+        Shared CLI runner from conftest.py
     """
     # Verify branch is marked as gone
-    exit_code, stdout, stderr = run_arb(["list"])
+    exit_code, stdout, stderr = list_result
     assert exit_code == 0
     assert "feature/gone" in stdout
     assert "gone" in stdout.lower()
 
     # Clean with auto-yes (gone branches should be cleaned)
-    exit_code, stdout, stderr = run_arb(["clean", "--no-interactive"])
+    exit_code, stdout, stderr = run_arb(cli_runner, ["clean", "--no-interactive"])
     assert exit_code == 0
     assert "feature/gone" in stdout
     assert "Successfully deleted" in stdout
 
     # Verify branch is gone
-    assert "feature/gone" not in [b.name for b in test_repo.heads]
-
-
-def test_clean_special_chars_branch(test_repo: GitRepo) -> None:
-    """Test cleaning a branch with special characters in its name.
-
-    Parameters
-    ----------
-    test_repo : GitRepo
-        Test repository
-    """
-    # Clean with auto-yes
-    exit_code, stdout, stderr = run_arb(["clean", "--no-interactive"])
-    assert exit_code == 0
-    assert "feature/special-chars-#123" in stdout
-    assert "Successfully deleted" in stdout
-
-    # Verify branch is gone
-    assert "feature/special-chars-#123" not in [b.name for b in test_repo.heads]
+    assert "feature/gone" not in head_names(test_repo)
 
 
-def test_clean_interactive_cancel(test_repo: GitRepo) -> None:
+def test_clean_interactive_cancel(test_repo: GitRepo, cli_runner: CliRunner) -> None:
     """Test canceling branch cleanup in interactive mode.
 
     Parameters
     ----------
     test_repo : GitRepo
         Test repository
+    cli_runner : CliRunner
+        Shared CLI runner from conftest.py
     """
     # Get initial branch list
-    initial_branches = {b.name for b in test_repo.heads}
+    initial_branches = head_names(test_repo)
 
-    # Run clean and respond with 'n'
-    exit_code, stdout, stderr = run_arb(["clean"], input_text="n")
+    # Run clean and answer the confirmation prompt with a full "n" line
+    exit_code, stdout, stderr = run_arb(cli_runner, ["clean"], input_text="n\n")
     assert exit_code == 0
     assert "Operation cancelled" in stdout
 
     # Verify no branches were deleted
-    final_branches = {b.name for b in test_repo.heads}
+    final_branches = head_names(test_repo)
     assert initial_branches == final_branches
 
 
-def test_clean_current_branch(test_repo: GitRepo) -> None:
+def test_clean_current_branch(test_repo: GitRepo, cli_runner: CliRunner) -> None:
     """Test attempting to clean the current branch.
 
     Parameters
     ----------
     test_repo : GitRepo
         Test repository
+    cli_runner : CliRunner
+        Shared CLI runner from conftest.py
     """
     # Switch to a merged branch
     test_repo.heads["feature/merged"].checkout()
 
     # Try to clean with force
-    exit_code, stdout, stderr = run_arb(["clean", "--force", "--no-interactive"])
+    exit_code, stdout, stderr = run_arb(cli_runner, ["clean", "--force", "--no-interactive"])
     assert exit_code == 0
 
     # Current branch should be skipped
-    assert "feature/merged" in [b.name for b in test_repo.heads]
+    assert "feature/merged" in head_names(test_repo)
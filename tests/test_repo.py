@@ -10,33 +10,6 @@ from arborist.errors import GitError
 from arborist.git.repo import GitRepo as ArboristRepo
 
 
-@pytest.fixture
-def temp_repo(tmp_path: Path) -> GitRepo:
-    """Create a temporary git repository.
-
-    Parameters
-    ----------
-    tmp_path : Path
-        Temporary directory path
-
-    Returns
-    -------
-    GitRepo
-        Temporary git repository
-    """
-    repo_path = tmp_path / "test_repo"
-    repo_path.mkdir()
-    repo = Repo.init(repo_path, initial_branch="main")
-
-    # Create initial commit
-    readme_path = repo_path / "README.md"
-    readme_path.write_text("# Test Repository")
-    repo.index.add(["README.md"])
-    repo.index.commit("Initial commit")
-
-    return repo
-
-
 def test_init_with_valid_path(temp_repo: GitRepo) -> None:
     """Test initializing GitRepo with a valid path.
 
@@ -47,6 +20,8 @@ def test_init_with_valid_path(temp_repo: GitRepo) -> None:
     """
     repo = ArboristRepo(temp_repo.working_dir)
     assert repo.repo.working_dir == temp_repo.working_dir
+    assert repo.branch_cleanup.status_manager is repo.branch_status
+    assert repo.repo.git.environment() == {"LC_ALL": "C", "GIT_OPTIONAL_LOCKS": "0"}
 
 
 def test_init_with_invalid_path(tmp_path: Path) -> None:
@@ -168,6 +143,25 @@ def test_get_gone_branches(temp_repo: GitRepo) -> None:
     assert isinstance(gone, list)
 
 
+def test_get_gone_branches_after_upstream_deletion(temp_repo: GitRepo) -> None:
+    """Test that a reused GitRepo sees an upstream deleted after its first query.
+
+    Parameters
+    ----------
+    temp_repo : GitRepo
+        Temporary git repository
+    """
+    temp_repo.create_head("feature/test", "HEAD")
+    temp_repo.git.push("--set-upstream", "origin", "feature/test")
+    repo = ArboristRepo(temp_repo.working_dir)
+    assert repo.get_gone_branches() == []
+
+    with Repo(temp_repo.remotes.origin.url) as remote:
+        remote.git.branch("-D", "feature/test")
+
+    assert repo.get_gone_branches() == ["feature/test"]
+
+
 def test_clean_with_dry_run(temp_repo: GitRepo) -> None:
     """Test cleaning branches with dry run.
 